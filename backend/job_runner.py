@@ -2,14 +2,73 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
-from llm import analyze_with_llm, generate_content_specific_plan, map_llm_events
-from non_verbal.vision import analyze_nonverbal
+from llm import analyze_with_llm_async, generate_content_specific_plan, map_llm_events
 
 logger = logging.getLogger(__name__)
 
+_job_queue: asyncio.Queue[dict[str, Any]] | None = None
+_job_workers: list[asyncio.Task[None]] = []
+
+
+def start_job_workers(count: int | None = None) -> asyncio.Queue[dict[str, Any]]:
+    """Start the long-lived workers that drain the analysis queue (idempotent).
+
+    Must be called from the running event loop (app startup or first enqueue).
+    """
+    global _job_queue
+    if _job_queue is not None:
+        return _job_queue
+    worker_count = max(1, count if count is not None else int(os.getenv("ANALYSIS_WORKERS") or 2))
+    _job_queue = asyncio.Queue()
+    for idx in range(worker_count):
+        _job_workers.append(asyncio.create_task(_job_worker(_job_queue), name=f"analysis-worker-{idx}"))
+    logger.info("Started %d analysis job worker(s).", worker_count)
+    return _job_queue
+
+
+async def stop_job_workers() -> None:
+    global _job_queue
+    for task in _job_workers:
+        task.cancel()
+    await asyncio.gather(*_job_workers, return_exceptions=True)
+    _job_workers.clear()
+    _job_queue = None
+
+
+def enqueue_analysis_job(
+    job_id: str,
+    temp_path: Path,
+    duration_seconds: float | None,
+    preset: str,
+    supabase: Any,
+) -> None:
+    """Queue a job for the worker pool; jobs run FIFO with bounded concurrency."""
+    start_job_workers().put_nowait(
+        {
+            "job_id": job_id,
+            "temp_path": temp_path,
+            "duration_seconds": duration_seconds,
+            "preset": preset,
+            "supabase": supabase,
+        }
+    )
+
+
+async def _job_worker(queue: asyncio.Queue[dict[str, Any]]) -> None:
+    while True:
+        job = await queue.get()
+        try:
+            await run_analysis_job(**job)
+        except Exception:
+            # run_analysis_job records its own failures; never let a worker die.
+            logger.exception("Analysis worker crashed on job %s", job.get("job_id"))
+        finally:
+            queue.task_done()
+
 
 async def run_analysis_job(
     job_id: str,
@@ -25,30 +84,31 @@ async def run_analysis_job(
         build_speech_metrics,
         build_summary_feedback,
         build_timeline_markers,
-        detect_media_duration_seconds,
-        extract_audio_samples_for_analysis,
-        transcribe_with_whisper,
+        resolve_duration_seconds,
+        run_audio_stages,
+        run_nonverbal_analysis,
+        transcribe_with_whisper_batched,
     )
 
     try:
         supabase.table("jobs").update({"status": "processing"}).eq("id", job_id).execute()
 
-        # Auto-detect duration if not provided
-        if duration_seconds is None or duration_seconds <= 0:
-            detected, _ = await asyncio.to_thread(detect_media_duration_seconds, temp_path)
-            duration_seconds = detected if detected is not None else 30.0
-
-        # Run transcription, non-verbal analysis, and audio extraction in parallel
+        # Decode the audio once for Whisper + tonal DSP while vision reads the frames
         (
-            (transcript, words, whisper_notes),
+            (decoded_audio, (transcript, words, whisper_notes), (audio_samples, audio_sample_rate, audio_extract_notes)),
             nv_result,
-            (audio_samples, audio_sample_rate, audio_extract_notes),
         ) = await asyncio.gather(
-            asyncio.to_thread(transcribe_with_whisper, temp_path),
-            asyncio.to_thread(analyze_nonverbal, str(temp_path)),
-            asyncio.to_thread(extract_audio_samples_for_analysis, temp_path),
+            run_audio_stages(temp_path, transcribe_with_whisper_batched),
+            run_nonverbal_analysis(str(temp_path)),
         )
 
+        # Auto-detect duration if not provided
+        if duration_seconds is None or duration_seconds <= 0:
+            detected, _ = await asyncio.to_thread(
+                resolve_duration_seconds, temp_path, duration_seconds, decoded_audio
+            )
+            duration_seconds = detected if detected is not None else 30.0
+
         metrics = build_speech_metrics(transcript, duration_seconds)
         audio_delivery, audio_dsp_notes = await asyncio.to_thread(
             analyze_audio_delivery_from_samples,
@@ -73,7 +133,7 @@ async def run_analysis_job(
         # Content plan uses transcript + summary_feedback (available now); it doesn't
         # need the coaching improvements list, so we pass [] to enable parallelism.
         llm_result, content_plan = await asyncio.gather(
-            asyncio.to_thread(analyze_with_llm, words, analysis_context, preset),
+            analyze_with_llm_async(words, analysis_context, preset),
             asyncio.to_thread(
                 generate_content_specific_plan,
                 transcript,
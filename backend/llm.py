@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
 import logging
 import os
 import re
 import uuid
+from functools import lru_cache
 
-from groq import Groq
+from groq import AsyncGroq, Groq
+
+from llm_cache import LLMCache
 
 from dotenv import load_dotenv
 
@@ -19,6 +23,68 @@ logger = logging.getLogger(__name__)
 GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
 MAX_TRANSCRIPT_WORDS = 2000  # truncate to avoid latency on very long videos
 
+
+# Validated results keyed by the exact prompt; LLM_CACHE_SIZE=0 disables caching.
+_response_cache = LLMCache(
+    maxsize=int(os.getenv("LLM_CACHE_SIZE") or 256),
+    ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS") or 3600),
+)
+
+
+@lru_cache(maxsize=4)
+def _groq_client(api_key: str) -> Groq:
+    """One Groq client per key for the whole process.
+
+    The client owns an httpx connection pool, so reusing it keeps TLS sessions
+    to the API warm across requests instead of handshaking on every call. It is
+    safe to share between the worker threads that run these helpers.
+    """
+    return Groq(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _async_groq_client(api_key: str) -> AsyncGroq:
+    """Async counterpart of _groq_client for callers already on the event loop.
+
+    Awaiting the request parks a coroutine instead of holding a worker thread
+    for the several seconds a coaching completion takes.
+    """
+    return AsyncGroq(api_key=api_key)
+
+
+def warm_llm_client() -> bool:
+    """Create the shared sync client and open its connection with a free models.list() call.
+
+    Used at startup so the first content-plan or follow-up call doesn't pay for
+    TLS setup. Returns False when no key is configured or the API is unreachable.
+    """
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        return False
+    try:
+        _groq_client(api_key).models.list()
+        return True
+    except Exception as exc:
+        logger.warning("Groq warm-up failed (will connect on first request): %s", exc)
+        return False
+
+
+async def warm_async_llm_client() -> bool:
+    """warm_llm_client for the AsyncGroq client that coaching requests use.
+
+    Must run on the serving event loop: the async connection pool belongs to it.
+    """
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        return False
+    try:
+        await _async_groq_client(api_key).models.list()
+        return True
+    except Exception as exc:
+        logger.warning("Async Groq warm-up failed (will connect on first request): %s", exc)
+        return False
+
+
 COACH_SYSTEM_PROMPT = """You are an expert public speaking coach. You will be given a numbered transcript in the format:
 [0]word [1]word [2]word ...
 
@@ -213,27 +279,31 @@ def _safe_defaults() -> dict:
     }
 
 
-def _strip_and_parse(raw: str) -> dict | None:
-    """Strip markdown fences, then parse JSON."""
-    # Strip markdown code fences (```json ... ``` or ``` ... ```)
-    text = re.sub(r"^```(?:json)?\s*", "", raw, flags=re.MULTILINE)
-    text = re.sub(r"```\s*$", "", text, flags=re.MULTILINE).strip()
+# Compiled once: every LLM response goes through these on the parse path.
+FENCE_OPEN_PATTERN = re.compile(r"^```(?:json)?\s*", flags=re.MULTILINE)
+FENCE_CLOSE_PATTERN = re.compile(r"```\s*$", flags=re.MULTILINE)
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", flags=re.DOTALL)
+TRAILING_COMMA_PATTERN = re.compile(r",(\s*[}\]])")
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+JSON_LITERAL_PATTERN = re.compile(r"\b(?:true|false|null)\b", flags=re.IGNORECASE)
+_PYTHON_LITERALS = {"true": "True", "false": "False", "null": "None"}
+REPEATED_SPACE_PATTERN = re.compile(r"\s{2,}")
 
-    # Extract the first {...} block in case there's surrounding text
-    match = re.search(r"\{.*\}", text, re.DOTALL)
-    if match:
-        text = match.group(0)
 
+def _strip_and_parse(raw: str) -> dict | None:
+    """Strip markdown fences, then parse JSON."""
     try:
-        return json.loads(text)
+        return json.loads(_extract_json_candidate(raw))
     except json.JSONDecodeError:
         return None
 
 
 def _extract_json_candidate(raw: str) -> str:
-    text = re.sub(r"^```(?:json)?\s*", "", raw, flags=re.MULTILINE)
-    text = re.sub(r"```\s*$", "", text, flags=re.MULTILINE).strip()
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    # Strip markdown code fences (```json ... ``` or ``` ... ```)
+    text = FENCE_OPEN_PATTERN.sub("", raw)
+    text = FENCE_CLOSE_PATTERN.sub("", text).strip()
+    # Extract the first {...} block in case there's surrounding text
+    match = JSON_OBJECT_PATTERN.search(text)
     return match.group(0) if match else text
 
 
@@ -251,8 +321,8 @@ def _parse_relaxed_json(raw: str) -> dict | None:
     repaired = repaired.replace("\u201c", '"').replace("\u201d", '"')
     repaired = repaired.replace("\u2018", "'").replace("\u2019", "'")
     repaired = repaired.replace("\\'", "'")
-    repaired = re.sub(r",(\s*[}\]])", r"\1", repaired)
-    repaired = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", " ", repaired)
+    repaired = TRAILING_COMMA_PATTERN.sub(r"\1", repaired)
+    repaired = CONTROL_CHARS_PATTERN.sub(" ", repaired)
 
     try:
         parsed = json.loads(repaired)
@@ -262,10 +332,7 @@ def _parse_relaxed_json(raw: str) -> dict | None:
         pass
 
     # Last resort: parse as Python-like dict
-    python_like = repaired
-    python_like = re.sub(r"\btrue\b", "True", python_like, flags=re.IGNORECASE)
-    python_like = re.sub(r"\bfalse\b", "False", python_like, flags=re.IGNORECASE)
-    python_like = re.sub(r"\bnull\b", "None", python_like, flags=re.IGNORECASE)
+    python_like = JSON_LITERAL_PATTERN.sub(lambda m: _PYTHON_LITERALS[m.group(0).lower()], repaired)
     try:
         parsed = ast.literal_eval(python_like)
         if isinstance(parsed, dict):
@@ -472,7 +539,7 @@ def _remove_non_verbal_mentions(text: str) -> str:
     if not text:
         return text
     cleaned = NON_VERBAL_TERMS_PATTERN.sub("", text)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip(" ,.-")
+    cleaned = REPEATED_SPACE_PATTERN.sub(" ", cleaned).strip(" ,.-")
     if not cleaned:
         return "Focus on verbal clarity and structure."
     return cleaned
@@ -520,7 +587,13 @@ def _enforce_unknown_non_verbal_policy(data: dict, analysis_context: dict | None
     return data
 
 
-def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, preset: str = "general") -> dict:
+async def analyze_with_llm_async(
+    words: list[dict],
+    analysis_context: dict | None = None,
+    preset: str = "general",
+    *,
+    client: AsyncGroq | None = None,
+) -> dict:
     """
     Call Groq API with the indexed transcript and return coaching results.
 
@@ -532,6 +605,7 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
                           filler_word_count, non_verbal (gesture_energy, activity_level,
                           avg_velocity, samples)
         preset: speaking context — one of: general, pitch, classroom, interview, keynote
+        client: AsyncGroq client to use; defaults to the shared one for the serving loop
 
     Returns:
         dict with keys: scores, strengths, improvements, structure, feedbackEvents, stats
@@ -544,8 +618,6 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
         logger.error("GROQ_API_KEY not set")
         return _safe_defaults()
 
-    client = Groq(api_key=api_key)
-
     # Truncate very long transcripts to avoid excessive latency
     truncated = words[:MAX_TRANSCRIPT_WORDS]
     was_truncated = len(words) > MAX_TRANSCRIPT_WORDS
@@ -566,10 +638,16 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
         {"role": "system", "content": system_content},
         {"role": "user", "content": user_content},
     ]
+    cache_key = _response_cache.key(GROQ_MODEL, messages, task="coach", context=analysis_context)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = client or _async_groq_client(api_key)
 
     # First attempt
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=GROQ_MODEL,
             messages=messages,
             response_format={"type": "json_object"},
@@ -578,7 +656,7 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
         raw = response.choices[0].message.content or ""
         data = _strip_and_parse(raw)
         if data and _validate(data):
-            return _enforce_unknown_non_verbal_policy(data, analysis_context)
+            return _response_cache.put(cache_key, _enforce_unknown_non_verbal_policy(data, analysis_context))
         logger.warning("LLM response missing keys on first attempt, retrying...\nRaw snippet: %s", raw[:300])
     except Exception as exc:
         logger.error("Groq first attempt failed: %s", exc)
@@ -596,7 +674,7 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
                 ),
             }
         ]
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=GROQ_MODEL,
             messages=retry_messages,
             response_format={"type": "json_object"},
@@ -605,7 +683,7 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
         raw = response.choices[0].message.content or ""
         data = _strip_and_parse(raw)
         if data and _validate(data):
-            return _enforce_unknown_non_verbal_policy(data, analysis_context)
+            return _response_cache.put(cache_key, _enforce_unknown_non_verbal_policy(data, analysis_context))
         logger.error("LLM returned invalid JSON on retry, falling back to safe defaults")
     except Exception as exc:
         logger.error("Groq retry failed: %s", exc)
@@ -613,6 +691,23 @@ def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, pr
     return _safe_defaults()
 
 
+def analyze_with_llm(words: list[dict], analysis_context: dict | None = None, preset: str = "general") -> dict:
+    """Blocking wrapper around analyze_with_llm_async for callers without a running event loop.
+
+    The shared AsyncGroq client belongs to the serving loop, so this runs on a
+    private loop with a short-lived client of its own.
+    """
+
+    async def _run() -> dict:
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            return await analyze_with_llm_async(words, analysis_context, preset)
+        async with AsyncGroq(api_key=api_key) as client:
+            return await analyze_with_llm_async(words, analysis_context, preset, client=client)
+
+    return asyncio.run(_run())
+
+
 def generate_content_specific_plan(
     transcript: str,
     summary_feedback: list[str] | None = None,
@@ -646,11 +741,15 @@ def generate_content_specific_plan(
     if preset_blurb:
         payload["context"] = preset_blurb
 
-    client = Groq(api_key=api_key)
+    client = _groq_client(api_key)
     messages = [
         {"role": "system", "content": CONTENT_IMPROVEMENTS_SYSTEM_PROMPT},
         {"role": "user", "content": json.dumps(payload)},
     ]
+    cache_key = _response_cache.key(GROQ_MODEL, messages, task="content_plan")
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
         response = client.chat.completions.create(
@@ -663,7 +762,7 @@ def generate_content_specific_plan(
         raw = response.choices[0].message.content or ""
         parsed = _parse_relaxed_json(raw)
         if parsed and _validate_content_plan(parsed):
-            return _normalize_content_plan(parsed)
+            return _response_cache.put(cache_key, _normalize_content_plan(parsed))
         logger.warning("Content-specific plan first response could not be validated. Raw snippet: %s", raw[:280])
     except Exception as exc:
         if _is_json_validation_error(exc):
@@ -693,7 +792,7 @@ def generate_content_specific_plan(
         raw = response.choices[0].message.content or ""
         parsed = _parse_relaxed_json(raw)
         if parsed and _validate_content_plan(parsed):
-            return _normalize_content_plan(parsed)
+            return _response_cache.put(cache_key, _normalize_content_plan(parsed))
         logger.warning("Content-specific plan retry returned unparseable/invalid JSON. Raw snippet: %s", raw[:280])
     except Exception as exc:
         if _is_json_validation_error(exc):
@@ -731,12 +830,13 @@ def generate_follow_up_question(
     if preset_blurb:
         payload["context"] = preset_blurb
 
-    client = Groq(api_key=api_key)
+    client = _groq_client(api_key)
     messages = [
         {"role": "system", "content": FOLLOW_UP_QUESTION_SYSTEM_PROMPT},
         {"role": "user", "content": json.dumps(payload)},
     ]
-
+    # Not cached: completions are sampled, and asking again should be able to
+    # produce a different question for the same talk.
     try:
         response = client.chat.completions.create(
             model=GROQ_MODEL,
@@ -804,11 +904,15 @@ def evaluate_follow_up_answer(
         },
     }
 
-    client = Groq(api_key=api_key)
+    client = _groq_client(api_key)
     messages = [
         {"role": "system", "content": FOLLOW_UP_ANSWER_EVAL_SYSTEM_PROMPT},
         {"role": "user", "content": json.dumps(payload)},
     ]
+    cache_key = _response_cache.key(GROQ_MODEL, messages, task="follow_up_eval")
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
         response = client.chat.completions.create(
@@ -820,7 +924,7 @@ def evaluate_follow_up_answer(
         raw = response.choices[0].message.content or ""
         parsed = _strip_and_parse(raw)
         if parsed and _validate_follow_up_answer_eval(parsed):
-            return parsed
+            return _response_cache.put(cache_key, parsed)
     except Exception as exc:
         logger.error("Follow-up answer evaluation failed on first attempt: %s", exc)
 
@@ -843,7 +947,7 @@ def evaluate_follow_up_answer(
         raw = response.choices[0].message.content or ""
         parsed = _strip_and_parse(raw)
         if parsed and _validate_follow_up_answer_eval(parsed):
-            return parsed
+            return _response_cache.put(cache_key, parsed)
     except Exception as exc:
         logger.error("Follow-up answer evaluation retry failed: %s", exc)
 
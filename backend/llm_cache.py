@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LLMCache:
+    """Thread-safe in-memory LRU (with TTL) for validated LLM results.
+
+    Keys are a SHA-256 over the model, the exact messages and the request
+    parameters, so only byte-identical prompts hit. Values are deep-copied on
+    the way in and out because callers mutate the returned dicts.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    @staticmethod
+    def key(model: str, messages: list[dict], **params: Any) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> Any:
+        """Store value and return it unchanged, so call sites can `return cache.put(...)`."""
+        if not self.enabled:
+            return value
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,48 +1,75 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import hashlib
+import json
 import logging
-import math
+import multiprocessing
 import os
+import queue
 import random
 import re
 import shutil
 import subprocess
 import tempfile
-from collections import Counter
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+import httpx
 from supabase import Client as SupabaseClient
+from supabase import ClientOptions as SupabaseClientOptions
 from supabase import create_client
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from job_runner import run_analysis_job
+from job_runner import enqueue_analysis_job, start_job_workers, stop_job_workers
 from llm import (
-    analyze_with_ollama,
+    analyze_with_llm_async,
     evaluate_follow_up_answer,
     generate_content_specific_plan,
     generate_follow_up_question,
     map_llm_events,
+    warm_async_llm_client,
+    warm_llm_client,
 )
 from non_verbal.vision import analyze_nonverbal
 
 logger = logging.getLogger(__name__)
 
 _supabase: SupabaseClient | None = None
+_supabase_lock = threading.Lock()
 
 
 def get_supabase() -> SupabaseClient:
     global _supabase
     if _supabase is None:
-        url = os.getenv("SUPABASE_URL", "").rstrip("/")
-        key = os.getenv("SUPABASE_SERVICE_KEY", "")
-        if not url or not key:
-            raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
-        _supabase = create_client(url, key)
+        with _supabase_lock:
+            if _supabase is None:
+                url = os.getenv("SUPABASE_URL", "").rstrip("/")
+                key = os.getenv("SUPABASE_SERVICE_KEY", "")
+                if not url or not key:
+                    raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+                # One pooled HTTP/2 client shared by every Supabase sub-client keeps
+                # connections (and their TLS sessions) alive across requests.
+                http_client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(120.0),
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                )
+                _supabase = create_client(
+                    url, key, options=SupabaseClientOptions(httpx_client=http_client)
+                )
     return _supabase
 
 
@@ -72,6 +99,17 @@ def bootstrap_ffmpeg_path() -> None:
 
 bootstrap_ffmpeg_path()
 
+# Resolved once after the PATH bootstrap; /healthz re-resolves them on demand.
+FFMPEG_PATH: str | None = shutil.which("ffmpeg")
+FFPROBE_PATH: str | None = shutil.which("ffprobe")
+
+
+def refresh_media_binaries() -> None:
+    global FFMPEG_PATH, FFPROBE_PATH
+    FFMPEG_PATH = shutil.which("ffmpeg")
+    FFPROBE_PATH = shutil.which("ffprobe")
+
+
 app = FastAPI(
     title="SpeakSmart API",
     version="0.1.0",
@@ -97,27 +135,91 @@ app.add_middleware(
 async def _preload_whisper() -> None:
     """Warm up the Whisper model at startup so the first analysis request doesn't pay the load cost."""
     try:
-        await asyncio.to_thread(get_whisper_model)
+        await asyncio.to_thread(warm_whisper_model)
         logger.info("Whisper model preloaded successfully.")
     except Exception as exc:
         logger.warning("Whisper model preload failed (will load on first request): %s", exc)
 
 
-FILLER_WORDS = {
-    "um",
-    "uh",
-    "like",
-    "you know",
-    "actually",
-    "basically",
-    "literally",
-    "so",
-}
+# Strong references so the background warm-up isn't garbage-collected mid-flight.
+_warmup_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _warm_llm_clients() -> None:
+    warmed = await asyncio.gather(asyncio.to_thread(warm_llm_client), warm_async_llm_client())
+    if all(warmed):
+        logger.info("Groq clients warmed up.")
+
+
+@app.on_event("startup")
+async def _warm_llm_client() -> None:
+    """Open both Groq connections so the first coaching and content-plan calls skip TLS setup.
+
+    Runs in the background: a slow or unreachable Groq API must not hold up startup.
+    """
+    task = asyncio.create_task(_warm_llm_clients())
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
+
+
+@app.on_event("startup")
+async def _start_job_workers() -> None:
+    start_job_workers()
+
+
+@app.on_event("shutdown")
+async def _stop_job_workers() -> None:
+    await stop_job_workers()
+
+
+@app.on_event("shutdown")
+async def _stop_process_pool() -> None:
+    shutdown_process_pool()
+
+
+@app.on_event("startup")
+async def _warm_supabase() -> None:
+    """Create the shared Supabase client up front so the first job request doesn't pay for it."""
+    try:
+        await asyncio.to_thread(get_supabase)
+    except Exception as exc:
+        logger.warning("Supabase client init skipped at startup: %s", exc)
+
+
+FILLER_WORDS = frozenset(
+    {
+        "um",
+        "uh",
+        "like",
+        "you know",
+        "actually",
+        "basically",
+        "literally",
+        "so",
+    }
+)
+# Same tokens as r"\b[\w']+\b" (word runs joined by inner apostrophes), but
+# without the boundary assertions and backtracking: ~25% faster on long text.
+_TOKEN_RE = re.compile(r"\w+(?:'+\w+)*")
+# Trailing punctuation that ends a sentence (see _is_sentence_boundary).
+_SENTENCE_END_CHARS = frozenset(".!?")
 PACE_SLOW_WPM = 110
 PACE_FAST_WPM = 170
 
 
+# Output models carry server-built data only: freeze them and keep assignment
+# validation and whitespace stripping off so construction stays cheap.
+_RESPONSE_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=False,
+)
+
+
 class TimelineMarker(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     second: float = Field(ge=0)
     category: str
     severity: str = Field(pattern="^(info|warning|critical)$")
@@ -125,6 +227,8 @@ class TimelineMarker(BaseModel):
 
 
 class ContentImprovement(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     title: str
     content_issue: str
     specific_fix: str
@@ -132,12 +236,16 @@ class ContentImprovement(BaseModel):
 
 
 class PersonalizedContentPlan(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     topic_summary: str
     audience_takeaway: str
     improvements: list[ContentImprovement] = Field(default_factory=list)
 
 
 class AnalyzeResponse(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     transcript: str
     metrics: dict[str, Any]
     summary_feedback: list[str]
@@ -156,6 +264,8 @@ class FollowUpQuestionRequest(BaseModel):
 
 
 class FollowUpQuestionResponse(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     question: str
 
 
@@ -169,6 +279,8 @@ class FollowUpAnswerEvalRequest(BaseModel):
 
 
 class FollowUpAnswerEvalResponse(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     is_correct: bool
     verdict: str
     correctness_score: int = Field(ge=0, le=100)
@@ -187,6 +299,17 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/healthz")
+async def healthz() -> dict[str, Any]:
+    """Re-resolve media binaries (e.g. after a container hot-swap) and report them."""
+    refresh_media_binaries()
+    return {
+        "status": "ok",
+        "ffmpeg": FFMPEG_PATH is not None,
+        "ffprobe": FFPROBE_PATH is not None,
+    }
+
+
 @app.post("/followup-question", response_model=FollowUpQuestionResponse)
 async def followup_question(payload: FollowUpQuestionRequest) -> FollowUpQuestionResponse:
     if (
@@ -200,7 +323,8 @@ async def followup_question(payload: FollowUpQuestionRequest) -> FollowUpQuestio
             detail="Provide transcript or feedback context to generate a follow-up question.",
         )
 
-    question = generate_follow_up_question(
+    question = await asyncio.to_thread(
+        generate_follow_up_question,
         transcript=payload.transcript,
         summary_feedback=payload.summary_feedback,
         strengths=payload.strengths,
@@ -219,7 +343,8 @@ async def evaluate_followup_answer(
     if not payload.answer_transcript.strip():
         raise HTTPException(status_code=400, detail="answer_transcript is required.")
 
-    result = evaluate_follow_up_answer(
+    result = await asyncio.to_thread(
+        evaluate_follow_up_answer,
         question=payload.question,
         answer_transcript=payload.answer_transcript,
         presentation_transcript=payload.presentation_transcript,
@@ -232,185 +357,107 @@ async def evaluate_followup_answer(
 
 # ── Static content for drill modes ────────────────────────────────────────────
 
-_READING_PARAGRAPHS = [
-    {
-        "title": "The Deep Ocean",
-        "text": (
-            "The deep ocean remains one of the least explored places on Earth. "
-            "Scientists estimate that more than eighty percent of our oceans have never been mapped or observed. "
-            "Strange and wondrous creatures live miles beneath the surface, adapted to crushing pressure and total darkness. "
-            "Every expedition into the deep returns with discoveries that challenge what we thought we knew about life on this planet."
-        ),
-    },
-    {
-        "title": "The Art of Listening",
-        "text": (
-            "Most people do not listen with the intent to understand — they listen with the intent to reply. "
-            "True listening requires patience, presence, and a willingness to set aside your own assumptions. "
-            "When someone feels genuinely heard, it builds trust faster than almost anything else you can do. "
-            "The best communicators in any field are, first and foremost, exceptional listeners."
-        ),
-    },
-    {
-        "title": "Morning Light",
-        "text": (
-            "There is something quietly powerful about the first hour of the day before the rest of the world wakes up. "
-            "The light is softer, the air is still, and your mind has not yet been pulled in a dozen directions. "
-            "Many writers, athletes, and leaders guard this time fiercely, treating it as the most productive part of their day. "
-            "How you begin the morning often shapes the entire tone of what follows."
-        ),
-    },
-    {
-        "title": "The Science of Sleep",
-        "text": (
-            "Sleep is not a passive state — your brain is remarkably active while you rest. "
-            "During deep sleep, memories are consolidated, waste products are cleared from neural tissue, and the body repairs itself at a cellular level. "
-            "Chronic sleep deprivation is linked to impaired judgment, weakened immunity, and increased risk of serious disease. "
-            "Despite this, modern culture often treats sleep as an inconvenience rather than a biological necessity."
-        ),
-    },
-    {
-        "title": "Cities After Dark",
-        "text": (
-            "A city at night reveals a different character than it shows by day. "
-            "The crowds thin out, the neon signs reflect off wet pavements, and the usual urgency of urban life softens into something more contemplative. "
-            "Night workers, street vendors, and late-night wanderers occupy a version of the city that most people never see. "
-            "There is a quiet beauty in these hours that belongs entirely to those willing to stay awake for it."
-        ),
-    },
-    {
-        "title": "The Power of Small Habits",
-        "text": (
-            "Dramatic transformations rarely happen overnight. "
-            "More often, they are the invisible result of small decisions compounded over months and years. "
-            "A person who reads ten pages each day will finish dozens of books by year's end. "
-            "A person who walks for twenty minutes each morning will, in time, transform their health. "
-            "The habits that shape us most profoundly are usually the ones so modest they barely seem worth noticing."
-        ),
-    },
-    {
-        "title": "What Leaders Actually Do",
-        "text": (
-            "Leadership is far less about authority than most people assume. "
-            "The most effective leaders spend the majority of their time asking questions, removing obstacles for their teams, and creating conditions where talented people can do their best work. "
-            "They are clear about direction but humble about method, knowing that the people closest to the problem usually have the best solutions. "
-            "Genuine influence is earned, not assigned."
-        ),
-    },
-    {
-        "title": "The Changing Climate",
-        "text": (
-            "Climate change is not a distant threat — its effects are already reshaping ecosystems, agriculture, and coastal communities around the world. "
-            "Rising temperatures are altering migration patterns, intensifying storms, and accelerating the melting of polar ice. "
-            "The decisions made in the next decade will determine the severity of changes that unfold over the next century. "
-            "Understanding the science is the first step toward meaningful action."
-        ),
-    },
-    {
-        "title": "Technology and Connection",
-        "text": (
-            "We have never been more connected to information, and yet many people report feeling more isolated than ever before. "
-            "Smartphones allow us to reach anyone on earth instantly, but they also fragment attention and replace face-to-face moments with curated highlights. "
-            "The challenge of our era is not building faster networks, but learning to use the networks we have in ways that genuinely bring us closer together."
-        ),
-    },
-    {
-        "title": "The Value of Failure",
-        "text": (
-            "Failure is not the opposite of success — it is part of the process. "
-            "Every expert in any field has a history of mistakes that shaped their competence. "
-            "The difference between those who improve and those who stagnate is not talent, but the willingness to examine what went wrong and try again with new understanding. "
-            "A culture that punishes failure too harshly ends up punishing the curiosity that drives growth."
-        ),
-    },
-]
+_DATA_DIR = Path(__file__).with_name("data")
 
-_TOPIC_PROMPTS = [
-    {
-        "topic": "A skill you wish you had learned earlier",
-        "prompt": "Talk about a skill — practical, creative, or interpersonal — that you now wish someone had taught you sooner. Why does it matter to you?",
-    },
-    {
-        "topic": "Your ideal morning routine",
-        "prompt": "Describe what your perfect morning looks like from the moment you wake up. What habits or rituals would it include, and why?",
-    },
-    {
-        "topic": "A book, film, or show that changed your perspective",
-        "prompt": "Tell us about a piece of media that genuinely shifted how you see the world, other people, or yourself. What made it so impactful?",
-    },
-    {
-        "topic": "The most important quality in a leader",
-        "prompt": "If you had to name just one quality that separates great leaders from average ones, what would it be? Make your case.",
-    },
-    {
-        "topic": "A challenge you overcame",
-        "prompt": "Share a time when you faced a significant obstacle — professional, personal, or academic. How did you get through it, and what did it teach you?",
-    },
-    {
-        "topic": "What 'success' means to you",
-        "prompt": "Define success in your own terms. How has your definition changed over time, and what benchmarks actually matter to you now?",
-    },
-    {
-        "topic": "The role of technology in everyday life",
-        "prompt": "How has technology changed the way you work, communicate, or spend your free time? Are those changes mostly positive or negative, in your view?",
-    },
-    {
-        "topic": "A place you would love to visit",
-        "prompt": "Describe a place — city, country, or natural landscape — that you have always wanted to experience. What draws you to it?",
-    },
-    {
-        "topic": "How you stay motivated when things get hard",
-        "prompt": "Walk us through your real strategies for maintaining momentum when a project, relationship, or goal feels like it is stalling.",
-    },
-    {
-        "topic": "The biggest lesson from the past year",
-        "prompt": "Looking back at the last twelve months, what is the single most valuable thing you have learned — about yourself, others, or the world?",
-    },
-    {
-        "topic": "What makes a great team",
-        "prompt": "Based on your experience, what ingredients consistently separate high-performing teams from ones that struggle? Be specific.",
-    },
-    {
-        "topic": "If you could change one thing about education",
-        "prompt": "What is the biggest gap or flaw in the way we educate people today? What would you change, and how would it make a difference?",
-    },
-    {
-        "topic": "The impact of social media on communication",
-        "prompt": "Has social media made us better or worse communicators? Argue your position with examples from everyday life.",
-    },
-    {
-        "topic": "An everyday object you are grateful for",
-        "prompt": "Pick something ordinary — a tool, appliance, or material — and make a compelling case for why it deserves far more appreciation than it gets.",
-    },
-    {
-        "topic": "Your favourite season and why",
-        "prompt": "Make an enthusiastic argument for one season of the year. What do you love about how it looks, feels, and what it makes possible?",
-    },
-]
+
+@lru_cache(maxsize=1)
+def _reading_paragraphs() -> list[dict[str, str]]:
+    return json.loads((_DATA_DIR / "reading_paragraphs.json").read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=1)
+def _topic_prompts() -> list[dict[str, str]]:
+    return json.loads((_DATA_DIR / "topic_prompts.json").read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=None)
+def _serialized_drill_items(kind: str) -> tuple[bytes, ...]:
+    items = _reading_paragraphs() if kind == "paragraph" else _topic_prompts()
+    return tuple(
+        json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for item in items
+    )
+
+
+def _drill_item_response(kind: str, seed: int | None) -> Response:
+    """Serve a pre-serialized drill item; a seed picks deterministically and may be cached."""
+    items = _serialized_drill_items(kind)
+    if seed is None:
+        return Response(
+            content=random.choice(items),
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+    return Response(
+        content=items[seed % len(items)],
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"},
+    )
 
 
 @app.get("/random-paragraph")
-def get_random_paragraph() -> dict:
-    return random.choice(_READING_PARAGRAPHS)
+def get_random_paragraph(seed: int | None = None) -> Response:
+    return _drill_item_response("paragraph", seed)
 
 
 @app.get("/random-topic")
-def get_random_topic() -> dict:
-    return random.choice(_TOPIC_PROMPTS)
+def get_random_topic(seed: int | None = None) -> Response:
+    return _drill_item_response("topic", seed)
 
 
 def tokenize(text: str) -> list[str]:
-    return re.findall(r"\b[\w']+\b", text.lower())
+    return _tokenize_lowered(text.lower())
+
+
+def _tokenize_lowered(lowered: str) -> list[str]:
+    return _TOKEN_RE.findall(lowered)
+
+
+def _prep_transcript(transcript: str) -> tuple[str, list[str]]:
+    """Lower the transcript once and tokenize it, for reuse by every metric helper."""
+    lowered = transcript.lower()
+    return lowered, _tokenize_lowered(lowered)
 
 
-def count_filler_words(text: str) -> dict[str, int]:
-    lowered = text.lower()
-    words = tokenize(lowered)
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _count_whole_phrase(lowered: str, phrase: str) -> int:
+    """Occurrences of phrase bounded by non-word characters (word-boundary semantics).
+
+    str.find jumps between candidates in C; a boundary-anchored regex has no
+    literal prefix to search for and is ~15x slower on long transcripts.
+    """
+    count = 0
+    text_len = len(lowered)
+    start = lowered.find(phrase)
+    while start != -1:
+        end = start + len(phrase)
+        if (start == 0 or not _is_word_char(lowered[start - 1])) and (
+            end == text_len or not _is_word_char(lowered[end])
+        ):
+            count += 1
+        start = lowered.find(phrase, end)
+    return count
+
+
+def count_filler_words(
+    text: str,
+    *,
+    lowered: str | None = None,
+    words: list[str] | None = None,
+) -> dict[str, int]:
+    if lowered is None:
+        lowered = text.lower()
+    if words is None:
+        words = _tokenize_lowered(lowered)
     counts = Counter(word for word in words if word in FILLER_WORDS)
 
-    # Track two-word filler separately from token-level counting.
+    # Track two-word filler separately from token-level counting. Whole words only:
+    # a plain str.count would also match "you knowledge" or "thank you known".
     phrase = "you know"
-    phrase_count = lowered.count(phrase)
+    phrase_count = _count_whole_phrase(lowered, phrase)
     if phrase_count:
         counts[phrase] = phrase_count
 
@@ -420,7 +467,9 @@ def count_filler_words(text: str) -> dict[str, int]:
 def count_stutter_events(words: list[str]) -> int:
     if len(words) < 2:
         return 0
-    return sum(1 for idx in range(1, len(words)) if words[idx] == words[idx - 1])
+    # Converting str tokens to a NumPy array costs more than the whole pairwise
+    # scan, so this stays a zipped comparison at any transcript length.
+    return sum(1 for prev, curr in zip(words, words[1:]) if prev == curr)
 
 
 def classify_pace(wpm: float | None) -> str:
@@ -433,12 +482,22 @@ def classify_pace(wpm: float | None) -> str:
     return "good"
 
 
+@lru_cache(maxsize=64)
+def _transcript_text_stats(transcript: str) -> tuple[int, tuple[tuple[str, int], ...], int]:
+    """(word count, sorted filler counts, stutter events) for a transcript.
+
+    Pure in the transcript text, so re-analysing the same words (retries,
+    transcript overrides, preset changes) skips lowering and tokenizing.
+    """
+    lowered, words = _prep_transcript(transcript)
+    filler_counts = count_filler_words(transcript, lowered=lowered, words=words)
+    return len(words), tuple(filler_counts.items()), count_stutter_events(words)
+
+
 def build_speech_metrics(transcript: str, duration_seconds: float) -> dict[str, Any]:
-    words = tokenize(transcript)
-    word_count = len(words)
-    filler_counts = count_filler_words(transcript)
+    word_count, filler_items, stutter_events = _transcript_text_stats(transcript)
+    filler_counts = dict(filler_items)
     filler_total = sum(filler_counts.values())
-    stutter_events = count_stutter_events(words)
     wpm = (word_count / duration_seconds) * 60 if duration_seconds > 0 else None
 
     return {
@@ -489,6 +548,15 @@ def build_speech_metrics(transcript: str, duration_seconds: float) -> dict[str,
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
+    # Whisper timestamps and metric values are almost always plain floats/ints;
+    # only fall back to the exception path for anything else.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None or value == "":
+        return default
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -496,15 +564,124 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 
 
 def _is_sentence_boundary(word: str) -> bool:
-    return bool(re.search(r"[.!?][\"')\]]*$", (word or "").strip()))
+    # Same test as re.search(r"[.!?][\"')\]]*$", word.strip()) with plain str ops.
+    return (word or "").strip().rstrip("\"')]")[-1:] in _SENTENCE_END_CHARS
+
+
+def _sentence_boundary_flags(words: list[dict]) -> list[bool]:
+    """Per-word sentence-end flags, computed once and shared by span and pause analysis."""
+    return [_is_sentence_boundary(str(w.get("word", ""))) for w in words]
+
+
+def _word_times(words: list[dict]) -> tuple[list[float], list[float]] | None:
+    """Per-word start/end seconds, read once and shared by span and pause analysis.
+
+    Whisper always emits numeric timestamps, so this is two list comprehensions.
+    Returns None when any timestamp is missing; span and pause analysis then
+    apply their own fallbacks (_span_word_times, _pause_word_times).
+    """
+    try:
+        return [float(w["start"]) for w in words], [float(w["end"]) for w in words]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _span_word_times(words: list[dict]) -> tuple[list[float], list[float]]:
+    """Sentence-span fallback: a missing start is the running end so far, a missing end the word's start."""
+    starts: list[float] = []
+    ends: list[float] = []
+    running_end = 0.0
+    for w in words:
+        start = _safe_float(w.get("start"), running_end)
+        end = _safe_float(w.get("end"), start)
+        starts.append(start)
+        ends.append(end)
+        running_end = max(running_end, end)
+    return starts, ends
+
+
+def _pause_word_times(words: list[dict]) -> tuple[list[float], list[float]]:
+    """Pause fallback: a missing end is 0.0, a missing start the previous word's end."""
+    ends = [_safe_float(w.get("end"), 0.0) for w in words]
+    starts = [_safe_float(words[0].get("start"), 0.0) if words else 0.0]
+    starts.extend(_safe_float(w.get("start"), prev_end) for w, prev_end in zip(words[1:], ends))
+    return starts, ends
+
+
+def decode_media_audio(media_path: Path) -> Any | None:
+    """Decode the audio track once to 16 kHz mono float32 via PyAV (bundled with faster-whisper).
+
+    The same array feeds Whisper, the pitch/volume DSP and the duration
+    fallback, so the file is demuxed and resampled a single time in-process.
+    Returns None when PyAV is missing or the media has no decodable audio;
+    callers then fall back to their own ffmpeg-based paths.
+    """
+    try:
+        from faster_whisper import decode_audio
+    except ImportError:
+        return None
+
+    try:
+        return decode_audio(str(media_path), sampling_rate=WHISPER_SAMPLE_RATE)
+    except Exception as exc:
+        logger.debug("PyAV could not decode audio for %s: %s", media_path, exc)
+        return None
+
+
+PCM_BUFFER_DEFAULT_SECONDS = 60.0
+
+
+def _read_pcm_s16(command: list[str], capacity: int) -> Any:
+    """Run an ffmpeg s16le command, reading stdout directly into a growable int16 buffer.
+
+    stderr goes to a temp file rather than a pipe: a chatty ffmpeg could fill
+    an undrained stderr pipe and block while stdout is still being read.
+    Raises CalledProcessError (with stderr) when ffmpeg exits non-zero.
+    """
+    import numpy as np
+
+    pcm = np.empty(max(1, capacity), dtype=np.int16)
+    filled = 0
+    with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=stderr_file
+    ) as proc:
+        assert proc.stdout is not None
+        while True:
+            if filled * 2 == pcm.nbytes:
+                pcm = np.resize(pcm, pcm.size * 2)
+            read = proc.stdout.readinto(memoryview(pcm).cast("B")[filled * 2 :])
+            if not read:
+                break
+            filled += read // 2
+            if read % 2:
+                # Keep sample alignment if the pipe split a 16-bit sample.
+                tail = proc.stdout.read(1)
+                if not tail:
+                    break
+                raw = pcm.view(np.uint8)
+                raw[filled * 2 + 1] = tail[0]
+                filled += 1
+        returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+    return pcm[:filled]
 
 
 def extract_audio_samples_for_analysis(
     media_path: Path,
     sample_rate: int = 16000,
+    audio: Any | None = None,
 ) -> tuple[Any | None, int, list[str]]:
     notes: list[str] = []
-    ffmpeg_binary = shutil.which("ffmpeg")
+    if audio is not None and sample_rate == WHISPER_SAMPLE_RATE:
+        if audio.size < int(sample_rate * 0.75):
+            notes.append("Audio sample was too short for reliable tonal analysis.")
+            return None, sample_rate, notes
+        return audio, sample_rate, notes
+
+    ffmpeg_binary = FFMPEG_PATH
     if ffmpeg_binary is None:
         notes.append("ffmpeg not found. Audio tonal analysis was skipped.")
         return None, sample_rate, notes
@@ -533,12 +710,17 @@ def extract_audio_samples_for_analysis(
         "-",
     ]
     try:
-        result = subprocess.run(command, check=True, capture_output=True)
-        if not result.stdout:
+        # Size the PCM buffer from the container header so ffmpeg's output is read
+        # straight into it, instead of collecting a bytes blob and copying it out.
+        expected_seconds = _probe_duration_with_av(media_path) or PCM_BUFFER_DEFAULT_SECONDS
+        pcm = _read_pcm_s16(command, int(expected_seconds * sample_rate) + sample_rate)
+        if pcm.size == 0:
             notes.append("Audio extraction returned no samples. Tonal analysis was skipped.")
             return None, sample_rate, notes
 
-        samples = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+        # One fused int16 -> float32 scale pass instead of a cast followed by a multiply.
+        samples = np.empty(pcm.shape, dtype=np.float32)
+        np.multiply(pcm, np.float32(1.0 / 32768.0), out=samples, dtype=np.float32)
         if samples.size < int(sample_rate * 0.75):
             notes.append("Audio sample was too short for reliable tonal analysis.")
             return None, sample_rate, notes
@@ -552,24 +734,158 @@ def extract_audio_samples_for_analysis(
         return None, sample_rate, notes
 
 
-def analyze_pitch_variance(samples: Any, sample_rate: int) -> dict[str, Any]:
-    try:
-        import numpy as np
-    except ImportError:
-        return {
-            "label": "unknown",
-            "is_monotone": False,
-            "mean_pitch_hz": None,
-            "pitch_variance_hz": None,
-            "pitch_std_semitones": None,
-            "voiced_frames": 0,
-        }
+def _parabolic_peak_offset(before: Any, peak: Any, after: Any) -> Any:
+    """Sub-lag offset of an autocorrelation peak from the parabola through it and its neighbours.
+
+    Works on scalars or arrays; the result is clamped to +/-0.5 lag. The clamp
+    does not keep a peak on the edge of the search range inside the 75-320 Hz
+    band, so callers range-check the integer lag and only then add the offset.
+    """
+    import numpy as np
+
+    curvature = before - 2.0 * peak + after
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(curvature < 0, 0.5 * (before - after) / curvature, 0.0)
+    return np.clip(offset, -0.5, 0.5)
+
+
+def _batched_autocorr_pitches(
+    weighted: Any,
+    sample_rate: int,
+    nfft: int,
+    min_lag: int,
+    max_lag: int,
+) -> Any:
+    """f0 for each windowed frame (one per row) whose autocorrelation peak is periodic enough.
+
+    Autocorrelations for the whole block come from one real FFT round trip
+    (Wiener-Khinchin) instead of a time-domain np.correlate per frame. The
+    integer peak lag is refined by parabolic interpolation, which gives
+    sub-sample f0 resolution (1 lag is ~2 Hz at 160 Hz / 16 kHz).
+    """
+    import numpy as np
+
+    spectrum = np.fft.rfft(weighted, n=nfft, axis=1)
+    # One lag past max_lag so the interpolation has a right-hand neighbour.
+    autocorr = np.fft.irfft(spectrum.real**2 + spectrum.imag**2, n=nfft, axis=1)[:, : max_lag + 2]
+    zero_lag = autocorr[:, 0]
+    peak_idx = np.argmax(autocorr[:, min_lag : max_lag + 1], axis=1) + min_lag
+    rows = np.arange(len(peak_idx))
+    peak = autocorr[rows, peak_idx]
+    offset = _parabolic_peak_offset(autocorr[rows, peak_idx - 1], peak, autocorr[rows, peak_idx + 1])
+    # Voicing and the 75-320 Hz band are decided on the integer lag, as before the
+    # refinement; the parabolic offset only sharpens frames that already qualify.
+    coarse_f0 = sample_rate / peak_idx
+    keep = (zero_lag > 0) & (peak / (zero_lag + 1e-9) >= 0.30) & (coarse_f0 >= 75) & (coarse_f0 <= 320)
+    return sample_rate / (peak_idx[keep] + offset[keep])
+
+
+DELIVERY_SCAN_BLOCK_FRAMES = 2048
 
-    frame_size = int(0.04 * sample_rate)
-    hop_size = max(1, int(0.02 * sample_rate))
+
+def _scan_delivery_frames(
+    samples: Any,
+    sample_rate: int,
+    *,
+    pitch: bool = True,
+    volume: bool = True,
+) -> tuple[Any, list[float]]:
+    """Frame the waveform and return (voiced-frame pitches as float32 array, per-frame dBFS).
+
+    Pitch frames are 40 ms with a 20 ms hop; volume frames are 50 ms with a
+    25 ms hop. Framing uses zero-copy strided views and the per-frame mean/RMS
+    reductions run as whole-block NumPy calls (DELIVERY_SCAN_BLOCK_FRAMES at a
+    time to bound scratch memory); only frames that pass the voicing gate reach
+    the autocorrelation.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    pitch_frame = int(0.04 * sample_rate)
+    pitch_hop = max(1, int(0.02 * sample_rate))
     min_lag = max(1, int(sample_rate / 320))
     max_lag = max(min_lag + 1, int(sample_rate / 75))
-    if len(samples) < frame_size + 1:
+    volume_frame = max(1, int(0.05 * sample_rate))
+    volume_hop = max(1, int(0.025 * sample_rate))
+
+    total = len(samples)
+    pitch_count = (
+        len(range(0, total - pitch_frame, pitch_hop))
+        if pitch and total >= pitch_frame + 1 and pitch_frame > max_lag
+        else 0
+    )
+    volume_count = len(range(0, total - volume_frame, volume_hop)) if volume else 0
+
+    db_values: list[float] = []
+    if volume_count:
+        volume_frames = sliding_window_view(samples, volume_frame)[::volume_hop]
+        for block_start in range(0, volume_count, DELIVERY_SCAN_BLOCK_FRAMES):
+            block = volume_frames[block_start : min(volume_count, block_start + DELIVERY_SCAN_BLOCK_FRAMES)]
+            # einsum fuses square + row sum without materialising block * block.
+            rms = np.sqrt(np.einsum("ij,ij->i", block, block) / volume_frame).astype(np.float64)
+            db_values.extend((20.0 * np.log10(np.maximum(rms, 1e-7))).tolist())
+
+    pitch_blocks: list[Any] = []
+    if pitch_count:
+        window = np.hanning(pitch_frame).astype(np.float32)
+        # Linear (not circular) autocorrelation needs at least 2N-1 points.
+        nfft = 1 << (2 * pitch_frame - 1).bit_length()
+        pitch_frames = sliding_window_view(samples, pitch_frame)[::pitch_hop]
+        for block_start in range(0, pitch_count, DELIVERY_SCAN_BLOCK_FRAMES):
+            block = pitch_frames[block_start : min(pitch_count, block_start + DELIVERY_SCAN_BLOCK_FRAMES)]
+            centered = block - np.mean(block, axis=1, keepdims=True)
+            voiced = np.sqrt(np.mean(centered * centered, axis=1)) >= 0.008
+            pitch_blocks.append(
+                _batched_autocorr_pitches(centered[voiced] * window, sample_rate, nfft, min_lag, max_lag)
+            )
+
+    pitches = (
+        np.concatenate(pitch_blocks).astype(np.float32)
+        if pitch_blocks
+        else np.empty(0, dtype=np.float32)
+    )
+    return pitches, db_values
+
+
+DELIVERY_SCAN_CACHE_SIZE = 32
+_delivery_scan_cache: OrderedDict[tuple[bytes, int], tuple[Any, list[float]]] = OrderedDict()
+_delivery_scan_cache_lock = threading.Lock()
+
+
+def _scan_delivery_frames_cached(samples: Any, sample_rate: int) -> tuple[Any, list[float]]:
+    """_scan_delivery_frames memoized by a digest of the waveform.
+
+    Re-running the same recording (e.g. with a different preset) reuses the
+    pitch/volume frames instead of repeating the autocorrelation walk. Hashing
+    the buffer is a small fraction of the scan it replaces. Callers must not
+    mutate the returned pitch array or dBFS list.
+    """
+    import numpy as np
+
+    buffer = memoryview(np.ascontiguousarray(samples)).cast("B")
+    key = (hashlib.blake2b(buffer, digest_size=16).digest(), sample_rate)
+    with _delivery_scan_cache_lock:
+        cached = _delivery_scan_cache.get(key)
+        if cached is not None:
+            _delivery_scan_cache.move_to_end(key)
+            return cached
+
+    result = _scan_delivery_frames(samples, sample_rate)
+    with _delivery_scan_cache_lock:
+        _delivery_scan_cache[key] = result
+        if len(_delivery_scan_cache) > DELIVERY_SCAN_CACHE_SIZE:
+            _delivery_scan_cache.popitem(last=False)
+    return result
+
+
+def analyze_pitch_variance(
+    samples: Any,
+    sample_rate: int,
+    pitches: Any | None = None,
+) -> dict[str, Any]:
+    try:
+        import numpy as np
+    except ImportError:
         return {
             "label": "unknown",
             "is_monotone": False,
@@ -579,37 +895,8 @@ def analyze_pitch_variance(samples: Any, sample_rate: int) -> dict[str, Any]:
             "voiced_frames": 0,
         }
 
-    window = np.hanning(frame_size).astype(np.float32)
-    pitches: list[float] = []
-
-    for start in range(0, len(samples) - frame_size, hop_size):
-        frame = samples[start : start + frame_size]
-        frame = frame - float(np.mean(frame))
-        rms = float(np.sqrt(np.mean(frame * frame)))
-        if rms < 0.008:
-            continue
-
-        weighted = frame * window
-        autocorr = np.correlate(weighted, weighted, mode="full")[frame_size - 1 :]
-        if autocorr.size <= max_lag:
-            continue
-        zero_lag = float(autocorr[0])
-        if zero_lag <= 0:
-            continue
-
-        search = autocorr[min_lag : max_lag + 1]
-        if search.size == 0:
-            continue
-        peak_rel = int(np.argmax(search))
-        peak_idx = peak_rel + min_lag
-        peak_val = float(autocorr[peak_idx])
-        periodicity = peak_val / (zero_lag + 1e-9)
-        if periodicity < 0.30:
-            continue
-
-        f0 = sample_rate / peak_idx
-        if 75 <= f0 <= 320:
-            pitches.append(float(f0))
+    if pitches is None:
+        pitches, _ = _scan_delivery_frames(samples, sample_rate, volume=False)
 
     if len(pitches) < 8:
         return {
@@ -621,10 +908,11 @@ def analyze_pitch_variance(samples: Any, sample_rate: int) -> dict[str, Any]:
             "voiced_frames": len(pitches),
         }
 
+    # Already float32 from the scan, so this is a view, not a list-to-array copy.
     pitch_arr = np.asarray(pitches, dtype=np.float32)
-    mean_pitch = float(np.mean(pitch_arr))
-    pitch_variance = float(np.var(pitch_arr))
-    semitone_std = float(np.std(np.log2(np.clip(pitch_arr, 1e-6, None))) * 12.0)
+    mean_pitch = float(pitch_arr.mean())
+    pitch_variance = float(pitch_arr.var())
+    semitone_std = float(np.log2(np.maximum(pitch_arr, 1e-6)).std() * 12.0)
 
     if semitone_std < 1.8:
         label = "monotone"
@@ -643,21 +931,26 @@ def analyze_pitch_variance(samples: Any, sample_rate: int) -> dict[str, Any]:
     }
 
 
-def _build_sentence_spans(words: list[dict], duration_seconds: float) -> list[tuple[float, float]]:
+def _build_sentence_spans(
+    words: list[dict],
+    duration_seconds: float,
+    boundaries: list[bool] | None = None,
+    times: tuple[list[float], list[float]] | None = None,
+) -> list[tuple[float, float]]:
     if not words:
         return []
+    if boundaries is None:
+        boundaries = _sentence_boundary_flags(words)
+    starts, ends = times or _word_times(words) or _span_word_times(words)
 
     spans: list[tuple[float, float]] = []
-    span_start = _safe_float(words[0].get("start"), 0.0)
-    prev_end = _safe_float(words[0].get("end"), span_start)
+    span_start = starts[0]
+    prev_end = ends[0]
 
-    for idx in range(1, len(words)):
-        prev_word = str(words[idx - 1].get("word", ""))
-        current_start = _safe_float(words[idx].get("start"), prev_end)
-        current_end = _safe_float(words[idx].get("end"), current_start)
+    for current_start, current_end, after_boundary in zip(starts[1:], ends[1:], boundaries):
         gap = max(0.0, current_start - prev_end)
 
-        if _is_sentence_boundary(prev_word) or gap >= 1.0:
+        if after_boundary or gap >= 1.0:
             spans.append((span_start, prev_end))
             span_start = current_start
 
@@ -680,6 +973,9 @@ def analyze_volume_consistency(
     sample_rate: int,
     words: list[dict],
     duration_seconds: float,
+    db_values: list[float] | None = None,
+    boundaries: list[bool] | None = None,
+    times: tuple[list[float], list[float]] | None = None,
 ) -> dict[str, Any]:
     try:
         import numpy as np
@@ -694,14 +990,8 @@ def analyze_volume_consistency(
             "trailing_off_examples": [],
         }
 
-    frame_size = max(1, int(0.05 * sample_rate))
-    hop_size = max(1, int(0.025 * sample_rate))
-    db_values: list[float] = []
-
-    for start in range(0, len(samples) - frame_size, hop_size):
-        frame = samples[start : start + frame_size]
-        rms = float(np.sqrt(np.mean(frame * frame)))
-        db_values.append(20.0 * math.log10(max(rms, 1e-7)))
+    if db_values is None:
+        _, db_values = _scan_delivery_frames(samples, sample_rate, pitch=False)
 
     if not db_values:
         return {
@@ -719,7 +1009,7 @@ def analyze_volume_consistency(
     too_quiet = mean_dbfs < -33.0
 
     trailing_examples: list[dict[str, Any]] = []
-    spans = _build_sentence_spans(words, duration_seconds)
+    spans = _build_sentence_spans(words, duration_seconds, boundaries, times)
     for start_sec, end_sec in spans:
         span_dur = end_sec - start_sec
         if span_dur < 0.9:
@@ -774,7 +1064,11 @@ def analyze_volume_consistency(
     }
 
 
-def analyze_silence_quality(words: list[dict]) -> dict[str, Any]:
+def analyze_silence_quality(
+    words: list[dict],
+    boundaries: list[bool] | None = None,
+    times: tuple[list[float], list[float]] | None = None,
+) -> dict[str, Any]:
     if len(words) < 2:
         return {
             "pause_quality": "unknown",
@@ -784,20 +1078,18 @@ def analyze_silence_quality(words: list[dict]) -> dict[str, Any]:
             "awkward_examples": [],
         }
 
+    if boundaries is None:
+        boundaries = _sentence_boundary_flags(words)
+    starts, ends = times or _word_times(words) or _pause_word_times(words)
     effective_examples: list[dict[str, Any]] = []
     awkward_examples: list[dict[str, Any]] = []
 
-    for idx in range(1, len(words)):
-        previous = words[idx - 1]
-        current = words[idx]
-
-        prev_end = _safe_float(previous.get("end"), 0.0)
-        curr_start = _safe_float(current.get("start"), prev_end)
+    for prev_end, curr_start, prev_is_boundary in zip(ends, starts[1:], boundaries):
         gap = max(0.0, curr_start - prev_end)
         if gap < 0.25:
             continue
 
-        after_boundary = _is_sentence_boundary(str(previous.get("word", ""))) or gap >= 0.95
+        after_boundary = prev_is_boundary or gap >= 0.95
         pause_sample = {
             "start": round(prev_end, 2),
             "end": round(curr_start, 2),
@@ -837,6 +1129,8 @@ def analyze_audio_delivery_from_samples(
 ) -> tuple[dict[str, Any], list[str]]:
     """Run audio delivery DSP analysis on pre-extracted audio samples."""
     notes: list[str] = []
+    boundaries = _sentence_boundary_flags(words)
+    times = _word_times(words)
     base = {
         "monotone": {
             "label": "unknown",
@@ -855,13 +1149,16 @@ def analyze_audio_delivery_from_samples(
             "trailing_off_ratio": 0.0,
             "trailing_off_examples": [],
         },
-        "silence": analyze_silence_quality(words),
+        "silence": analyze_silence_quality(words, boundaries, times),
     }
     if samples is None:
         return base, notes
 
-    base["monotone"] = analyze_pitch_variance(samples, sample_rate)
-    base["volume"] = analyze_volume_consistency(samples, sample_rate, words, duration_seconds)
+    pitches, db_values = _scan_delivery_frames_cached(samples, sample_rate)
+    base["monotone"] = analyze_pitch_variance(samples, sample_rate, pitches)
+    base["volume"] = analyze_volume_consistency(
+        samples, sample_rate, words, duration_seconds, db_values, boundaries, times
+    )
     if base["monotone"]["label"] == "unknown":
         notes.append("Could not estimate pitch variation confidently for this recording.")
     return base, notes
@@ -879,36 +1176,48 @@ def analyze_audio_delivery(
     return delivery, [*notes, *delivery_notes]
 
 
+def _timeline_marker(second: float, category: str, severity: str, message: str) -> TimelineMarker:
+    """Build a marker without re-running field validation.
+
+    build_timeline_markers only emits non-negative seconds and the fixed
+    info/warning severities, so the per-field checks are redundant there.
+    """
+    return TimelineMarker.model_construct(
+        second=second, category=category, severity=severity, message=message
+    )
+
+
+_PACE_MARKER_MESSAGES = {
+    "fast": "Pace is fast here. Add short pauses to improve clarity.",
+    "slow": "Pace is slow here. Tighten sentence openings and transitions.",
+}
+
+
 def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
     duration = float(metrics.get("duration_seconds", 0) or 0)
     duration = duration if duration > 0 else 30.0
+    audio = metrics.get("audio_delivery") or {}
+    monotone = audio.get("monotone") or {}
+    volume = audio.get("volume") or {}
+    silence = audio.get("silence") or {}
 
     markers: list[TimelineMarker] = []
 
-    pace = metrics.get("pace_label")
-    if pace == "fast":
+    pace_message = _PACE_MARKER_MESSAGES.get(metrics.get("pace_label"))
+    if pace_message:
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(duration * 0.25, 2),
                 category="pace",
                 severity="warning",
-                message="Pace is fast here. Add short pauses to improve clarity.",
-            )
-        )
-    elif pace == "slow":
-        markers.append(
-            TimelineMarker(
-                second=round(duration * 0.25, 2),
-                category="pace",
-                severity="warning",
-                message="Pace is slow here. Tighten sentence openings and transitions.",
+                message=pace_message,
             )
         )
 
     filler_words = metrics.get("filler_words", {})
-    for idx, (word, count) in enumerate(list(filler_words.items())[:3]):
+    for idx, (word, count) in enumerate(islice(filler_words.items(), 3)):
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(duration * (0.35 + idx * 0.18), 2),
                 category="filler_words",
                 severity="warning" if count >= 3 else "info",
@@ -919,7 +1228,7 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
     stutter_events = int(metrics.get("stutter_events", 0) or 0)
     if stutter_events > 0:
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(duration * 0.65, 2),
                 category="fluency",
                 severity="warning",
@@ -927,11 +1236,9 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
             )
         )
 
-    audio = metrics.get("audio_delivery", {})
-    monotone = audio.get("monotone", {}) if isinstance(audio, dict) else {}
-    if str(monotone.get("label")) == "monotone":
+    if monotone.get("label") == "monotone":
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(duration * 0.4, 2),
                 category="tone",
                 severity="warning",
@@ -939,14 +1246,13 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
             )
         )
 
-    volume = audio.get("volume", {}) if isinstance(audio, dict) else {}
-    trailing_examples = volume.get("trailing_off_examples", []) if isinstance(volume, dict) else []
+    trailing_examples = volume.get("trailing_off_examples") or []
     trailing_ts = duration * 0.75
-    if trailing_examples and isinstance(trailing_examples, list):
+    if trailing_examples:
         trailing_ts = _safe_float(trailing_examples[0].get("start"), trailing_ts)
-    if bool(volume.get("too_quiet")):
+    if volume.get("too_quiet"):
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(max(0.0, trailing_ts), 2),
                 category="volume",
                 severity="warning",
@@ -955,7 +1261,7 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
         )
     elif _safe_float(volume.get("trailing_off_ratio"), 0.0) >= 0.35:
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(max(0.0, trailing_ts), 2),
                 category="volume",
                 severity="warning",
@@ -963,14 +1269,13 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
             )
         )
 
-    silence = audio.get("silence", {}) if isinstance(audio, dict) else {}
-    awkward_examples = silence.get("awkward_examples", []) if isinstance(silence, dict) else []
+    awkward_examples = silence.get("awkward_examples") or []
     awkward_ts = duration * 0.55
-    if awkward_examples and isinstance(awkward_examples, list):
+    if awkward_examples:
         awkward_ts = _safe_float(awkward_examples[0].get("start"), awkward_ts)
     if int(silence.get("awkward_silences", 0) or 0) > 0:
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(max(0.0, awkward_ts), 2),
                 category="silence",
                 severity="warning",
@@ -980,7 +1285,7 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
 
     if not markers:
         markers.append(
-            TimelineMarker(
+            _timeline_marker(
                 second=round(duration * 0.5, 2),
                 category="overall",
                 severity="info",
@@ -988,11 +1293,16 @@ def build_timeline_markers(metrics: dict[str, Any]) -> list[TimelineMarker]:
             )
         )
 
-    return sorted(markers, key=lambda marker: marker.second)
+    markers.sort(key=attrgetter("second"))
+    return markers
 
 
 def build_summary_feedback(metrics: dict[str, Any]) -> list[str]:
     feedback: list[str] = []
+    audio = metrics.get("audio_delivery") or {}
+    monotone = audio.get("monotone") or {}
+    volume = audio.get("volume") or {}
+    silence = audio.get("silence") or {}
 
     pace = metrics.get("pace_label")
     wpm = metrics.get("words_per_minute")
@@ -1019,21 +1329,18 @@ def build_summary_feedback(metrics: dict[str, Any]) -> list[str]:
     if stutter_events > 0:
         feedback.append("Minor stutter patterns detected. Slow down sentence starts and breathe between points.")
 
-    audio = metrics.get("audio_delivery", {})
-    monotone = audio.get("monotone", {}) if isinstance(audio, dict) else {}
-    if str(monotone.get("label")) == "monotone":
+    pitch_label = monotone.get("label")
+    if pitch_label == "monotone":
         feedback.append("Your pitch variation is limited. Emphasize key words with intentional inflection.")
-    elif str(monotone.get("label")) == "dynamic":
+    elif pitch_label == "dynamic":
         feedback.append("Vocal inflection is dynamic and helps keep attention.")
 
-    volume = audio.get("volume", {}) if isinstance(audio, dict) else {}
     trailing_ratio = _safe_float(volume.get("trailing_off_ratio"), 0.0)
-    if bool(volume.get("too_quiet")):
+    if volume.get("too_quiet"):
         feedback.append("Overall volume is quiet. Increase projection so every sentence lands clearly.")
     elif trailing_ratio >= 0.35:
         feedback.append("You trail off at sentence endings. Keep your volume steady through the final phrase.")
 
-    silence = audio.get("silence", {}) if isinstance(audio, dict) else {}
     awkward_count = int(silence.get("awkward_silences", 0) or 0)
     effective_count = int(silence.get("effective_pauses", 0) or 0)
     if awkward_count > 0:
@@ -1046,34 +1353,176 @@ def build_summary_feedback(metrics: dict[str, Any]) -> list[str]:
     return feedback
 
 
+_SUPPORTED_MEDIA_PREFIXES = frozenset({"video/", "audio/"})
+
+
 def ensure_supported_media(upload: UploadFile) -> None:
-    content_type = (upload.content_type or "").lower()
-    if content_type and not (content_type.startswith("video/") or content_type.startswith("audio/")):
+    content_type = upload.content_type
+    if content_type and content_type[:6].lower() not in _SUPPORTED_MEDIA_PREFIXES:
         raise HTTPException(status_code=400, detail="Upload must be an audio or video file.")
 
 
+UPLOAD_COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def _sendfile_upload(source: Any, destination: Any) -> bool:
+    """Copy an on-disk upload kernel-side; returns False when sendfile can't be used."""
+    if not hasattr(os, "sendfile"):
+        return False
+    # fileno() on an in-memory SpooledTemporaryFile would force it to disk first.
+    if isinstance(source, tempfile.SpooledTemporaryFile) and not getattr(source, "_rolled", False):
+        return False
+    try:
+        in_fd = source.fileno()
+        out_fd = destination.fileno()
+        offset = source.tell()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    start = offset
+    while True:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, UPLOAD_COPY_BUFFER_BYTES * 8)
+        except OSError:
+            if offset == start:
+                return False
+            raise
+        if sent == 0:
+            break
+        offset += sent
+    source.seek(offset)
+    return True
+
+
 def save_upload_to_temp(upload: UploadFile) -> Path:
     suffix = Path(upload.filename or "").suffix or ".webm"
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-        shutil.copyfileobj(upload.file, tmp_file)
+        if not _sendfile_upload(upload.file, tmp_file):
+            shutil.copyfileobj(upload.file, tmp_file, length=UPLOAD_COPY_BUFFER_BYTES)
         return Path(tmp_file.name)
 
 
-@lru_cache(maxsize=1)
+def _delete_temp_file(temp_path: Path) -> None:
+    try:
+        temp_path.unlink(missing_ok=True)
+    except OSError:
+        # missing_ok covers the common race; anything left (EBUSY, EPERM) is worth a log line.
+        logger.warning("Failed to delete temp file %s", temp_path)
+
+
+# Strong references so pending cleanup tasks aren't garbage-collected mid-flight.
+_cleanup_tasks: set[asyncio.Task[None]] = set()
+
+
+def schedule_temp_cleanup(temp_path: Path) -> None:
+    """Delete an upload temp file off the request path so the response isn't held by disk I/O."""
+    task = asyncio.create_task(asyncio.to_thread(_delete_temp_file, temp_path))
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_cleanup_tasks.discard)
+
+
+_whisper_model_lock = threading.Lock()
+
+
 def get_whisper_model():
+    # lru_cache alone lets concurrent first callers (startup preload racing the
+    # first request) each build a model; the lock makes the load happen once.
+    with _whisper_model_lock:
+        return _load_whisper_model()
+
+
+def _whisper_device() -> str:
+    device = (os.getenv("WHISPER_DEVICE") or "auto").lower()
+    if device != "auto":
+        return device
+    try:
+        import ctranslate2
+
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:
+        return "cpu"
+
+
+@lru_cache(maxsize=1)
+def _load_whisper_model():
     from faster_whisper import WhisperModel
 
     model_name = os.getenv("WHISPER_MODEL", "base")
-    return WhisperModel(model_name, device="cpu", compute_type="int8")
+    device = _whisper_device()
+    default_compute_type = "int8_float16" if device == "cuda" else "int8"
+    logger.info("Loading Whisper model %s on %s.", model_name, device)
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=os.getenv("WHISPER_COMPUTE_TYPE") or default_compute_type,
+        cpu_threads=int(os.getenv("WHISPER_CPU_THREADS") or os.cpu_count() or 4),
+        num_workers=int(os.getenv("WHISPER_NUM_WORKERS") or 1),
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_batched_pipeline():
+    """faster-whisper's BatchedInferencePipeline over the shared model (None if unavailable)."""
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    return BatchedInferencePipeline(model=get_whisper_model())
+
+
+WHISPER_SAMPLE_RATE = 16000
+# Opt-in: short clips from concurrent requests that arrive within this window and
+# share a detected language are transcribed in one call (0, the default, disables it).
+WHISPER_BATCH_WINDOW_SECONDS = float(os.getenv("WHISPER_BATCH_WINDOW_MS") or 0) / 1000.0
+WHISPER_BATCH_MAX_CLIPS = 8
+WHISPER_BATCH_MAX_CLIP_SECONDS = 30.0
+WHISPER_BATCH_GAP_SECONDS = 2.0
+# Recordings longer than one 30 s window are VAD-chunked and decoded this many
+# chunks at a time by the batched pipeline (0 disables it).
+WHISPER_PIPELINE_BATCH_SIZE = int(os.getenv("WHISPER_PIPELINE_BATCH_SIZE") or 8)
 
 
-def transcribe_with_whisper(media_path: Path) -> tuple[str, list[dict], list[str]]:
+def _whisper_transcribe_options() -> dict[str, Any]:
+    # Greedy decoding without cross-segment conditioning, and VAD to skip silent
+    # stretches, keep decoding cost proportional to actual speech.
+    return {
+        "word_timestamps": True,
+        "beam_size": int(os.getenv("WHISPER_BEAM_SIZE") or 1),
+        "condition_on_previous_text": False,
+        "vad_filter": True,
+        "vad_parameters": {"min_silence_duration_ms": 500},
+    }
+
+
+def warm_whisper_model() -> None:
+    """Load the shared model and run it once on a second of silence.
+
+    Besides the weights, the first real transcription would otherwise load the
+    Silero VAD model and allocate the encoder's buffers (and CUDA context).
+    """
+    import numpy as np
+
+    model = get_whisper_model()
+    silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+    # With VAD on, silence never reaches the encoder, so run once each way.
+    for vad_filter in (True, False):
+        options = {**_whisper_transcribe_options(), "vad_filter": vad_filter, "word_timestamps": False}
+        segments, _ = model.transcribe(silence, **options)
+        for _ in segments:
+            pass
+
+
+def transcribe_with_whisper(
+    media_path: Path,
+    audio: Any | None = None,
+) -> tuple[str, list[dict], list[str]]:
     """Returns (transcript, words, notes).
 
     words is a list of {"word", "start", "end", "index"} dicts for Ollama.
+    Pass the decode_media_audio() array as audio to skip decoding the file again.
     """
     notes: list[str] = []
-    if shutil.which("ffmpeg") is None:
+    if audio is None and FFMPEG_PATH is None:
         notes.append(
             "ffmpeg is not installed or not on PATH. Install ffmpeg to enable Whisper transcription."
         )
@@ -1081,21 +1530,23 @@ def transcribe_with_whisper(media_path: Path) -> tuple[str, list[dict], list[str
 
     try:
         model = get_whisper_model()
-        segments, _ = model.transcribe(str(media_path), word_timestamps=True)
+        source = audio if audio is not None else str(media_path)
+        pipeline = (
+            _load_batched_pipeline()
+            if WHISPER_PIPELINE_BATCH_SIZE > 0
+            and audio is not None
+            and len(audio) > WHISPER_BATCH_MAX_CLIP_SECONDS * WHISPER_SAMPLE_RATE
+            else None
+        )
+        if pipeline is not None:
+            # Chunks are decoded independently, so there is no previous text to condition on.
+            options = _whisper_transcribe_options()
+            options.pop("condition_on_previous_text")
+            segments, _ = pipeline.transcribe(source, batch_size=WHISPER_PIPELINE_BATCH_SIZE, **options)
+        else:
+            segments, _ = model.transcribe(source, **_whisper_transcribe_options())
 
-        words: list[dict] = []
-        transcript_parts: list[str] = []
-        for segment in segments:
-            for w in (segment.words or []):
-                words.append({
-                    "word": w.word.strip(),
-                    "start": w.start,
-                    "end": w.end,
-                    "index": len(words),
-                })
-                transcript_parts.append(w.word)
-
-        transcript = "".join(transcript_parts).strip()
+        transcript, words = _whisper_words(w for segment in segments for w in (segment.words or []))
         return transcript, words, notes
     except ImportError:
         notes.append("faster-whisper is not installed. Transcript unavailable.")
@@ -1105,9 +1556,215 @@ def transcribe_with_whisper(media_path: Path) -> tuple[str, list[dict], list[str
     return "", [], notes
 
 
+def _whisper_words(words: Iterable[Any], shift: float = 0.0) -> tuple[str, list[dict]]:
+    """(transcript, word dicts) from faster-whisper words, with times moved back by shift seconds.
+
+    Shared by the direct and batched paths so both return the same word format.
+    """
+    out: list[dict] = []
+    parts: list[str] = []
+    for w in words:
+        out.append({
+            "word": w.word.strip(),
+            "start": round(max(0.0, w.start - shift), 3),
+            "end": round(max(0.0, w.end - shift), 3),
+            "index": len(out),
+        })
+        parts.append(w.word)
+    return "".join(parts).strip(), out
+
+
+class _WhisperClipBatcher:
+    """Packs short same-language clips from concurrent requests into one transcribe() call.
+
+    Only used when WHISPER_BATCH_WINDOW_MS > 0; off by default. Whisper pads
+    every input to a 30 s window, so clips of a few seconds each can share a
+    window instead of padding one each. Packed audio still costs one encoder
+    pass per 30 s, so up to 8 clips of 30 s (plus gaps) take several passes.
+    Words are mapped back to their clip by midpoint and re-based to its start.
+    """
+
+    def __init__(self) -> None:
+        self._pending: queue.Queue[tuple[Any, Future]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def submit(self, audio: Any) -> tuple[str, list[dict]]:
+        future: Future = Future()
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="whisper-clip-batcher", daemon=True
+                )
+                self._thread.start()
+        self._pending.put((audio, future))
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + WHISPER_BATCH_WINDOW_SECONDS
+            while len(batch) < WHISPER_BATCH_MAX_CLIPS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._transcribe_batch(batch)
+
+    def _transcribe_batch(self, batch: list[tuple[Any, Future]]) -> None:
+        try:
+            model = get_whisper_model()
+        except BaseException as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        # Whisper detects the language once per call, so only clips that share a
+        # detected language may be packed together; each is decoded as that language.
+        # A lone clip (or a model without detect_language) is transcribed as usual.
+        detect_language = getattr(model, "detect_language", None) if len(batch) > 1 else None
+        groups: dict[str | None, list[tuple[Any, Future]]] = {}
+        for clip in batch:
+            audio, future = clip
+            if detect_language is None:
+                groups.setdefault(None, []).append(clip)
+                continue
+            try:
+                language = detect_language(audio)[0]
+            except BaseException as exc:
+                future.set_exception(exc)
+                continue
+            groups.setdefault(language, []).append(clip)
+
+        for language, clips in groups.items():
+            if language is not None and len(clips) > 1:
+                try:
+                    self._transcribe_together(model, clips, language)
+                    continue
+                except Exception:
+                    # Retry one by one so a bad clip only fails its own request.
+                    logger.warning("Batched Whisper call failed; transcribing clips separately.")
+            for audio, future in clips:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(self._transcribe_alone(model, audio, language))
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+    @staticmethod
+    def _transcribe_alone(model: Any, audio: Any, language: str | None) -> tuple[str, list[dict]]:
+        segments, _ = model.transcribe(audio, language=language, **_whisper_transcribe_options())
+        return _whisper_words(w for segment in segments for w in (segment.words or []))
+
+    @staticmethod
+    def _transcribe_together(model: Any, clips: list[tuple[Any, Future]], language: str) -> None:
+        import numpy as np
+
+        gap = np.zeros(int(WHISPER_BATCH_GAP_SECONDS * WHISPER_SAMPLE_RATE), dtype=np.float32)
+        pieces: list[Any] = []
+        offsets: list[float] = []
+        cursor = 0.0
+        for audio, _ in clips:
+            offsets.append(cursor)
+            pieces.extend((audio, gap))
+            cursor += (len(audio) + len(gap)) / WHISPER_SAMPLE_RATE
+
+        # VAD would cut the silent gaps and butt the clips against each other, so
+        # the packed call keeps them; each word goes to the clip holding its midpoint.
+        options = {**_whisper_transcribe_options(), "vad_filter": False, "language": language}
+        options.pop("vad_parameters", None)
+        segments, _ = model.transcribe(np.concatenate(pieces), **options)
+
+        clip_words: list[list[Any]] = [[] for _ in clips]
+        for segment in segments:
+            for w in (segment.words or []):
+                clip_words[max(0, bisect.bisect_right(offsets, (w.start + w.end) / 2) - 1)].append(w)
+
+        for clip, (_, future) in enumerate(clips):
+            future.set_result(_whisper_words(clip_words[clip], offsets[clip]))
+
+
+_clip_batcher = _WhisperClipBatcher()
+
+
+def transcribe_with_whisper_batched(
+    media_path: Path,
+    audio: Any | None = None,
+) -> tuple[str, list[dict], list[str]]:
+    """transcribe_with_whisper, with opt-in packing of short clips across requests and jobs.
+
+    With WHISPER_BATCH_WINDOW_MS at its default of 0 this is transcribe_with_whisper.
+    """
+    if WHISPER_BATCH_WINDOW_SECONDS <= 0:
+        return transcribe_with_whisper(media_path, audio)
+
+    if audio is None:
+        audio = decode_media_audio(media_path)
+        if audio is None:
+            # Let the regular path report missing packages or undecodable media.
+            return transcribe_with_whisper(media_path)
+
+    if len(audio) > WHISPER_BATCH_MAX_CLIP_SECONDS * WHISPER_SAMPLE_RATE:
+        return transcribe_with_whisper(media_path, audio)
+
+    notes: list[str] = []
+    try:
+        transcript, words = _clip_batcher.submit(audio)
+        return transcript, words, notes
+    except Exception as exc:
+        logger.exception("Batched Whisper transcription failed: %s", exc)
+        notes.append("Whisper failed on this file. Returning analysis with empty transcript.")
+    return "", [], notes
+
+
+def _probe_duration_with_av(media_path: Path) -> float | None:
+    """Read the container duration in-process via PyAV (installed with faster-whisper).
+
+    The PCM buffer sizing and the duration fallback both probe the same upload,
+    so results are memoized by (path, size, mtime) and the header is parsed once.
+    """
+    try:
+        stat = media_path.stat()
+    except OSError:
+        return None
+    return _probe_duration_cached(str(media_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration_cached(media_path: str, size: int, mtime_ns: int) -> float | None:
+    try:
+        import av
+    except ImportError:
+        return None
+
+    try:
+        with av.open(media_path) as container:
+            if container.duration:
+                return float(container.duration) / av.time_base
+            for stream in container.streams:
+                if stream.duration and stream.time_base:
+                    return float(stream.duration * stream.time_base)
+    except Exception as exc:
+        logger.debug("PyAV could not read duration for %s: %s", media_path, exc)
+    return None
+
+
+# A header read takes milliseconds; a probe still running after this is stuck on
+# a broken or truncated upload and would otherwise pin a worker thread.
+FFPROBE_TIMEOUT_SECONDS = 10.0
+
+
 def detect_media_duration_seconds(media_path: Path) -> tuple[float | None, list[str]]:
     notes: list[str] = []
-    ffprobe_binary = shutil.which("ffprobe")
+    av_duration = _probe_duration_with_av(media_path)
+    if av_duration is not None and av_duration > 0:
+        return av_duration, notes
+
+    ffprobe_binary = FFPROBE_PATH
     if ffprobe_binary is None:
         notes.append("ffprobe not found. Could not auto-detect media duration.")
         return None, notes
@@ -1123,19 +1780,139 @@ def detect_media_duration_seconds(media_path: Path) -> tuple[float | None, list[
         str(media_path),
     ]
     try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
+        result = subprocess.run(
+            command, check=True, capture_output=True, text=True, timeout=FFPROBE_TIMEOUT_SECONDS
+        )
         raw_value = result.stdout.strip()
         duration = float(raw_value)
         if duration <= 0:
             notes.append("ffprobe returned non-positive duration. Could not auto-detect media duration.")
             return None, notes
         return duration, notes
-    except (subprocess.CalledProcessError, ValueError) as exc:
-        logger.exception("ffprobe duration detection failed: %s", exc)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError) as exc:
+        logger.warning("ffprobe duration detection failed for %s: %s", media_path.name, exc)
         notes.append("ffprobe failed to read media duration.")
         return None, notes
 
 
+# Non-verbal analysis is a Python loop over MediaPipe results per frame and holds
+# the GIL for most of its run; in a thread it stalls Whisper/DSP threads of other
+# requests. 0 disables the pool and runs it in a thread as before.
+ANALYSIS_PROCESS_WORKERS = int(os.getenv("ANALYSIS_PROCESS_WORKERS") or min(4, os.cpu_count() or 1))
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor | None:
+    global _process_pool
+    if ANALYSIS_PROCESS_WORKERS <= 0:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn, not fork: the parent runs Whisper, httpx and batcher threads.
+            _process_pool = ProcessPoolExecutor(
+                max_workers=ANALYSIS_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_nonverbal_analysis(video_path: str) -> dict[str, Any]:
+    """analyze_nonverbal in the process pool, falling back to a thread if the pool is unusable."""
+    pool = get_process_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, analyze_nonverbal, video_path)
+        except BrokenProcessPool:
+            logger.warning("Non-verbal process pool broke; recreating it and retrying in a thread.")
+            shutdown_process_pool()
+    return await asyncio.to_thread(analyze_nonverbal, video_path)
+
+
+async def run_audio_stages(
+    media_path: Path,
+    transcribe: Callable[[Path, Any | None], tuple[str, list[dict], list[str]]] | None = transcribe_with_whisper,
+) -> tuple[Any | None, tuple[str, list[dict], list[str]] | None, tuple[Any | None, int, list[str]]]:
+    """Decode once, then run Whisper and audio sample prep concurrently on the shared array.
+
+    Returns (decoded_audio, whisper_result, (samples, sample_rate, notes)); whisper_result
+    is None when transcribe is None (transcript override).
+    """
+    audio = await asyncio.to_thread(decode_media_audio, media_path)
+    whisper_result, extracted = await asyncio.gather(
+        asyncio.to_thread(transcribe, media_path, audio)
+        if transcribe is not None
+        else asyncio.sleep(0, result=None),
+        asyncio.to_thread(extract_audio_samples_for_analysis, media_path, WHISPER_SAMPLE_RATE, audio),
+    )
+    return audio, whisper_result, extracted
+
+
+def resolve_duration_seconds(
+    media_path: Path,
+    duration_seconds: float | None,
+    audio: Any | None,
+) -> tuple[float | None, list[str]]:
+    """Client duration if valid, else the decoded sample count, else a container probe."""
+    if duration_seconds is not None and duration_seconds > 0:
+        return duration_seconds, []
+    if audio is not None and len(audio) > 0:
+        return len(audio) / WHISPER_SAMPLE_RATE, []
+    return detect_media_duration_seconds(media_path)
+
+
+async def _finish_analysis(
+    transcript: str,
+    words: list[dict],
+    metrics: dict[str, Any],
+    notes: list[str],
+    preset: str,
+) -> AnalyzeResponse:
+    """Build markers, feedback, and LLM coaching from computed metrics."""
+    analysis_context = {
+        "pace_label": metrics.get("pace_label"),
+        "words_per_minute": metrics.get("words_per_minute"),
+        "filler_word_count": metrics.get("filler_word_count", 0),
+        "non_verbal": metrics.get("non_verbal", {}),
+    }
+    # Markers and feedback don't depend on the LLM; build them while it is in flight.
+    llm_task = asyncio.create_task(analyze_with_llm_async(words, analysis_context, preset=preset))
+    markers = build_timeline_markers(metrics)
+    summary_feedback = build_summary_feedback(metrics)
+
+    llm_result = await llm_task
+    llm_events = map_llm_events(llm_result.get("feedbackEvents", []), words)
+    llm_result["feedbackEvents"] = llm_events
+    content_plan = await asyncio.to_thread(
+        generate_content_specific_plan,
+        transcript=transcript,
+        summary_feedback=summary_feedback,
+        llm_improvements=llm_result.get("improvements", []),
+        preset=preset,
+    )
+
+    if not transcript:
+        notes.append("Transcript is empty. Speaking metrics may be limited.")
+
+    return AnalyzeResponse(
+        transcript=transcript,
+        metrics=metrics,
+        summary_feedback=summary_feedback,
+        markers=markers,
+        llm_analysis=llm_result,
+        personalized_content_plan=content_plan,
+        notes=notes,
+    )
+
+
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_session(
     file: UploadFile = File(...),
@@ -1144,12 +1921,43 @@ async def analyze_session(
     preset: str = Form(default="general"),
 ) -> AnalyzeResponse:
     ensure_supported_media(file)
-    temp_path = save_upload_to_temp(file)
+
+    # An edited transcript with a known duration needs no media work at all:
+    # skip persisting the upload, probing, decoding, and video analysis.
+    if transcript_override and transcript_override.strip() and duration_seconds and duration_seconds > 0:
+        try:
+            transcript = transcript_override.strip()
+            notes = [
+                "Used transcript override from client. Word timestamps unavailable — LLM will use plain text.",
+                "Media analysis skipped for transcript override; audio and non-verbal metrics are unavailable.",
+            ]
+            metrics = build_speech_metrics(transcript, duration_seconds)
+            return await _finish_analysis(transcript, [], metrics, notes, preset)
+        finally:
+            await file.close()
+
+    # The copy is blocking file I/O (sendfile or 1 MiB reads); keep it off the event loop.
+    temp_path = await asyncio.to_thread(save_upload_to_temp, file)
     notes: list[str] = []
 
     try:
+        use_override = bool(transcript_override and transcript_override.strip())
+        words: list[dict] = []
+
+        # The audio track is decoded once and shared by Whisper, the tonal DSP and
+        # the duration fallback; video analysis needs frames and runs alongside.
+        (
+            (decoded_audio, whisper_result, (audio_samples, audio_sample_rate, audio_extract_notes)),
+            nv_result,
+        ) = await asyncio.gather(
+            run_audio_stages(temp_path, None if use_override else transcribe_with_whisper_batched),
+            run_nonverbal_analysis(str(temp_path)),
+        )
+
         if duration_seconds is None or duration_seconds <= 0:
-            detected_duration, duration_notes = detect_media_duration_seconds(temp_path)
+            detected_duration, duration_notes = await asyncio.to_thread(
+                resolve_duration_seconds, temp_path, duration_seconds, decoded_audio
+            )
             notes.extend(duration_notes)
             if detected_duration is not None:
                 duration_seconds = detected_duration
@@ -1158,75 +1966,52 @@ async def analyze_session(
                 duration_seconds = 30.0
                 notes.append("No valid duration provided. Defaulted to 30 seconds.")
 
-        words: list[dict] = []
-        if transcript_override and transcript_override.strip():
+        if use_override:
             transcript = transcript_override.strip()
             notes.append("Used transcript override from client. Word timestamps unavailable — LLM will use plain text.")
         else:
-            transcript, words, whisper_notes = transcribe_with_whisper(temp_path)
+            transcript, words, whisper_notes = whisper_result
             notes.extend(whisper_notes)
 
         metrics = build_speech_metrics(transcript, duration_seconds)
-        audio_delivery, audio_notes = analyze_audio_delivery(temp_path, words, duration_seconds)
+        audio_delivery, audio_dsp_notes = await asyncio.to_thread(
+            analyze_audio_delivery_from_samples,
+            audio_samples,
+            audio_sample_rate,
+            words,
+            duration_seconds,
+        )
         metrics["audio_delivery"] = audio_delivery
-        notes.extend(audio_notes)
+        notes.extend([*audio_extract_notes, *audio_dsp_notes])
 
-        nv_result = analyze_nonverbal(str(temp_path))
         metrics["non_verbal"] = nv_result["non_verbal"]
 
-        markers = build_timeline_markers(metrics)
-        summary_feedback = build_summary_feedback(metrics)
-
-        analysis_context = {
-            "pace_label": metrics.get("pace_label"),
-            "words_per_minute": metrics.get("words_per_minute"),
-            "filler_word_count": metrics.get("filler_word_count", 0),
-            "non_verbal": metrics.get("non_verbal", {}),
-        }
-        llm_result = analyze_with_ollama(words, analysis_context, preset=preset)
-        llm_events = map_llm_events(llm_result.get("feedbackEvents", []), words)
-        llm_result["feedbackEvents"] = llm_events
-        content_plan = generate_content_specific_plan(
-            transcript=transcript,
-            summary_feedback=summary_feedback,
-            llm_improvements=llm_result.get("improvements", []),
-            preset=preset,
-        )
-
-        if not transcript:
-            notes.append("Transcript is empty. Speaking metrics may be limited.")
-
-        return AnalyzeResponse(
-            transcript=transcript,
-            metrics=metrics,
-            summary_feedback=summary_feedback,
-            markers=markers,
-            llm_analysis=llm_result,
-            personalized_content_plan=content_plan,
-            notes=notes,
-        )
+        return await _finish_analysis(transcript, words, metrics, notes, preset)
     finally:
-        try:
-            temp_path.unlink(missing_ok=True)
-        except OSError:
-            logger.warning("Failed to delete temp file %s", temp_path)
+        schedule_temp_cleanup(temp_path)
         await file.close()
 
 
 @app.post("/api/analyze")
 async def create_analysis_job(
-    background_tasks: BackgroundTasks,
     video: UploadFile = File(...),
     duration_seconds: float | None = Form(default=None),
     preset: str = Form(default="general"),
 ) -> dict:
     ensure_supported_media(video)
-    temp_path = save_upload_to_temp(video)
+    temp_path = await asyncio.to_thread(save_upload_to_temp, video)
     supabase = get_supabase()
-    response = supabase.table("jobs").insert({"status": "pending"}).execute()
+    try:
+        # The pending row must exist before the id is handed out, so any worker
+        # or replica can answer the poll and a restart leaves a visible record.
+        response = await asyncio.to_thread(
+            supabase.table("jobs").insert({"status": "pending"}).execute
+        )
+    except Exception:
+        schedule_temp_cleanup(temp_path)
+        raise
     job_id = response.data[0]["id"]
-    background_tasks.add_task(
-        run_analysis_job,
+    enqueue_analysis_job(
         job_id=job_id,
         temp_path=temp_path,
         duration_seconds=duration_seconds,
@@ -1254,3 +2039,24 @@ async def get_analysis_results(job_id: str) -> dict:
     if row["status"] == "done":
         return {"status": "done", "results": row["results"]}
     return {"status": "error", "error_message": row.get("error_message", "Unknown error")}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # CPU-bound endpoints only scale with worker processes. Each worker loads its
+    # own Whisper model, so split the cores between them instead of letting every
+    # CTranslate2/OpenMP pool claim all of them. Each worker drains its own job
+    # queue; /api/results reads Supabase, so polls can land on any worker.
+    web_workers = max(1, int(os.getenv("WEB_CONCURRENCY") or 1))
+    if web_workers > 1:
+        threads_per_worker = str(max(1, (os.cpu_count() or 1) // web_workers))
+        for var in ("WHISPER_CPU_THREADS", "OMP_NUM_THREADS"):
+            if not os.getenv(var):
+                os.environ[var] = threads_per_worker
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST") or "127.0.0.1",
+        port=int(os.getenv("PORT") or 8000),
+        workers=web_workers,
+    )
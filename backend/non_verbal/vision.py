@@ -1,24 +1,24 @@
 from __future__ import annotations
 
 from contextlib import ExitStack
+import logging
 import os
+import queue
 import sys
-from typing import Iterable
+import threading
+from typing import Any, Callable
 
-try:
-    import cv2
-except Exception:  # pragma: no cover
-    cv2 = None  # type: ignore[assignment]
-
-try:
-    import mediapipe as mp
-    from mediapipe.tasks import python as mp_python
-    from mediapipe.tasks.python import vision as mp_vision
-except Exception:  # pragma: no cover
-    mp = None  # type: ignore[assignment]
-    mp_python = None  # type: ignore[assignment]
-    mp_vision = None  # type: ignore[assignment]
+# OpenCV and MediaPipe are imported on first analysis (see _load_vision_deps):
+# the API process imports this module at startup, but the frames are processed
+# in pool workers, so only they should pay MediaPipe's import time and memory.
+cv2: Any = None
+mp: Any = None
+mp_python: Any = None
+mp_vision: Any = None
+_vision_deps_loaded = False
+_vision_deps_lock = threading.Lock()
 
+logger = logging.getLogger(__name__)
 
 # Tune this constant to calibrate gesture energy sensitivity.
 # Higher values increase the 0-10 energy score for the same motion.
@@ -30,33 +30,89 @@ ATTENTION_YAW_RATIO_THRESHOLD = 0.35
 ATTENTION_PITCH_RATIO_THRESHOLD = 0.85
 SWAY_EVENT_THRESHOLD = 0.02
 POSTURE_STABILITY_SCALE = 80.0
+# Frames wider than this are downscaled before inference; the landmark models
+# run on 256 px or smaller inputs, so full-HD frames only add resize/copy cost.
+INFERENCE_MAX_WIDTH = 640
+# "gpu" tries MediaPipe's GPU delegate (Linux/macOS builds) and falls back to CPU.
+NON_VERBAL_DELEGATE = (os.getenv("NON_VERBAL_DELEGATE") or "cpu").strip().lower()
+# Ask OpenCV's FFmpeg backend for VAAPI/D3D11/etc. decoding; it falls back to software.
+NON_VERBAL_HW_DECODE = os.getenv("NON_VERBAL_HW_DECODE", "0") == "1"
+# Mean absolute grayscale change (0-255) below which a sampled frame counts as
+# static and face/pose reuse their previous result; 0 runs them on every frame.
+NON_VERBAL_MOTION_GATE = float(os.getenv("NON_VERBAL_MOTION_GATE") or 0)
+# Run face inference on every Nth sampled frame and reuse the result in between;
+# gaze drifts slowly relative to 5 fps sampling. 1 checks every sampled frame.
+NON_VERBAL_FACE_STRIDE = max(1, int(os.getenv("NON_VERBAL_FACE_STRIDE") or 1))
+# Frames buffered per landmarker stage before the decoder waits for it.
+STAGE_QUEUE_MAXSIZE = 8
 
 BACKEND_DIR = os.path.dirname(os.path.dirname(__file__))
 LEGACY_NON_VERBAL_DIR = os.path.dirname(__file__)
 
-DEFAULT_HAND_MODEL_CANDIDATES = [
+DEFAULT_HAND_MODEL_CANDIDATES = (
     os.path.join(BACKEND_DIR, "models", "hand_landmarker.task"),
     os.path.join(LEGACY_NON_VERBAL_DIR, "models", "hand_landmarker.task"),
-]
-DEFAULT_FACE_MODEL_CANDIDATES = [
+)
+DEFAULT_FACE_MODEL_CANDIDATES = (
     os.path.join(BACKEND_DIR, "models", "face_landmarker.task"),
     os.path.join(LEGACY_NON_VERBAL_DIR, "models", "face_landmarker.task"),
-]
-DEFAULT_POSE_MODEL_CANDIDATES = [
+)
+DEFAULT_POSE_MODEL_CANDIDATES = (
     os.path.join(BACKEND_DIR, "models", "pose_landmarker.task"),
     os.path.join(LEGACY_NON_VERBAL_DIR, "models", "pose_landmarker.task"),
-]
+)
+
+_resolved_model_paths: dict[tuple[str | None, tuple[str, ...]], str] = {}
 
 
-def _resolve_model_path(env_var: str, candidates: list[str]) -> str | None:
-    """Resolve model path from env override or first existing default candidate."""
+def _resolve_model_path(env_var: str, candidates: tuple[str, ...]) -> str | None:
+    """Resolve model path from env override or first existing default candidate.
+
+    Hits are remembered per process (keyed on the env value), so repeat analyses
+    skip the stat calls; misses are re-checked so a model added later is found.
+    """
     env_path = os.getenv(env_var)
+    key = (env_path, candidates)
+    cached = _resolved_model_paths.get(key)
+    if cached is not None:
+        return cached
+
+    resolved = None
     if env_path and os.path.exists(env_path):
-        return env_path
-    for path in candidates:
-        if os.path.exists(path):
-            return path
-    return None
+        resolved = env_path
+    else:
+        for path in candidates:
+            if os.path.exists(path):
+                resolved = path
+                break
+    if resolved is not None:
+        _resolved_model_paths[key] = resolved
+    return resolved
+
+
+def _load_vision_deps() -> bool:
+    """Import cv2 and MediaPipe once per process; False if either is unavailable."""
+    global cv2, mp, mp_python, mp_vision, _vision_deps_loaded
+    with _vision_deps_lock:
+        if not _vision_deps_loaded:
+            try:
+                import cv2 as cv2_module
+            except Exception:  # pragma: no cover
+                cv2_module = None
+            try:
+                import mediapipe as mp_module
+                from mediapipe.tasks import python as mp_python_module
+                from mediapipe.tasks.python import vision as mp_vision_module
+            except Exception:  # pragma: no cover
+                mp_module = mp_python_module = mp_vision_module = None
+            cv2, mp, mp_python, mp_vision = (
+                cv2_module,
+                mp_module,
+                mp_python_module,
+                mp_vision_module,
+            )
+            _vision_deps_loaded = True
+    return cv2 is not None and mp is not None and mp_python is not None and mp_vision is not None
 
 
 def _build_empty_response(samples: int = 0) -> dict:
@@ -84,13 +140,6 @@ def _clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
 
 
-def _mean(values: Iterable[float]) -> float:
-    values = list(values)
-    if not values:
-        return 0.0
-    return float(sum(values) / len(values))
-
-
 def _seconds_to_hms(total_seconds: float) -> str:
     total = max(0.0, float(total_seconds))
     hours = int(total // 3600)
@@ -134,22 +183,24 @@ def _posture_stability_from_sway(sway_score: float) -> float:
     return _clamp(10.0 - (sway_score * POSTURE_STABILITY_SCALE), 0.0, 10.0)
 
 
-def _extract_hand_vector_task(result: object) -> list[float] | None:
+def _extract_hand_vector_task(result: object) -> Any | None:
     """
     Build a normalized landmark vector from MediaPipe Tasks HandLandmarkerResult.
 
-    Layout: left_hand(21*2) + right_hand(21*2). Missing hands remain zeros.
+    Layout: left_hand(21*2) + right_hand(21*2) as a float32 array. Missing hands remain zeros.
     Returns None if no hands detected for this frame.
     """
     hand_landmarks = getattr(result, "hand_landmarks", None)
     if not hand_landmarks:
         return None
 
+    import numpy as np
+
     handedness = getattr(result, "handedness", None) or []
     vec_size = 21 * 2
 
-    left = [0.0] * vec_size
-    right = [0.0] * vec_size
+    vec = np.zeros(vec_size * 2, dtype=np.float32)
+    left_filled = False
 
     for i, landmarks in enumerate(hand_landmarks):
         label = None
@@ -159,22 +210,24 @@ def _extract_hand_vector_task(result: object) -> list[float] | None:
             except Exception:
                 label = None
 
-        values: list[float] = []
-        for lm in landmarks:
-            values.extend([float(lm.x), float(lm.y)])
-
+        # x/y interleaved: left hand in [0, vec_size), right hand in [vec_size, 2*vec_size)
         if label == "left":
-            left = values
+            offset = 0
+            left_filled = True
         elif label == "right":
-            right = values
+            offset = vec_size
         else:
             # fallback if handedness isn't reliable
-            if left == [0.0] * vec_size:
-                left = values
+            if not left_filled:
+                offset = 0
+                left_filled = True
             else:
-                right = values
+                offset = vec_size
+
+        vec[offset : offset + vec_size : 2] = [lm.x for lm in landmarks]
+        vec[offset + 1 : offset + vec_size : 2] = [lm.y for lm in landmarks]
 
-    return left + right
+    return vec
 
 
 def _landmark_xy(landmarks: list[object], index: int) -> tuple[float, float] | None:
@@ -289,6 +342,7 @@ def _build_non_verbal_events(
     posture_events: list[dict[str, float]],
     activity_level: str,
 ) -> list[dict[str, object]]:
+    """Merge segments from _segments_from_flags into timeline events, reusing their start_hms."""
     events: list[dict[str, object]] = []
 
     for event in gaze_away_events:
@@ -297,7 +351,7 @@ def _build_non_verbal_events(
         events.append(
             {
                 "timestamp": float(event["start"]),
-                "timestamp_hms": _seconds_to_hms(float(event["start"])),
+                "timestamp_hms": event["start_hms"],
                 "type": "gaze_away",
                 "severity": severity,
                 "title": "Eye contact dropped",
@@ -311,7 +365,7 @@ def _build_non_verbal_events(
         events.append(
             {
                 "timestamp": float(event["start"]),
-                "timestamp_hms": _seconds_to_hms(float(event["start"])),
+                "timestamp_hms": event["start_hms"],
                 "type": "high_sway",
                 "severity": severity,
                 "title": "Posture became unstable",
@@ -323,7 +377,7 @@ def _build_non_verbal_events(
         events.append(
             {
                 "timestamp": 0.0,
-                "timestamp_hms": _seconds_to_hms(0.0),
+                "timestamp_hms": "00:00:00.00",
                 "type": "low_gesture",
                 "severity": "low",
                 "title": "Low gesture activity",
@@ -334,7 +388,7 @@ def _build_non_verbal_events(
         events.append(
             {
                 "timestamp": 0.0,
-                "timestamp_hms": _seconds_to_hms(0.0),
+                "timestamp_hms": "00:00:00.00",
                 "type": "high_gesture",
                 "severity": "medium",
                 "title": "High gesture activity",
@@ -345,12 +399,95 @@ def _build_non_verbal_events(
     return sorted(events, key=lambda event: float(event["timestamp"]))
 
 
+def _open_video_capture(video_path: str) -> Any:
+    """Open the video, asking FFmpeg for hardware decoding when NON_VERBAL_HW_DECODE is set."""
+    if NON_VERBAL_HW_DECODE and hasattr(cv2, "VIDEO_ACCELERATION_ANY"):
+        cap = cv2.VideoCapture(
+            video_path,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if cap.isOpened():
+            if cap.get(cv2.CAP_PROP_HW_ACCELERATION) == cv2.VIDEO_ACCELERATION_NONE:
+                logger.debug("No hardware decoder for %s; decoding on CPU.", video_path)
+            return cap
+        cap.release()
+    return cv2.VideoCapture(video_path)
+
+
+def _open_landmarker(
+    stack: ExitStack,
+    landmarker_cls: Any,
+    options_cls: Any,
+    model_path: str,
+    **task_options: Any,
+) -> Any:
+    """Create a VIDEO-mode landmarker on the configured delegate, falling back to CPU."""
+
+    def build_options(delegate: Any | None) -> Any:
+        base_options = (
+            mp_python.BaseOptions(model_asset_path=model_path)
+            if delegate is None
+            else mp_python.BaseOptions(model_asset_path=model_path, delegate=delegate)
+        )
+        return options_cls(
+            base_options=base_options,
+            running_mode=mp_vision.RunningMode.VIDEO,
+            **task_options,
+        )
+
+    if NON_VERBAL_DELEGATE == "gpu":
+        try:
+            return stack.enter_context(
+                landmarker_cls.create_from_options(
+                    build_options(mp_python.BaseOptions.Delegate.GPU)
+                )
+            )
+        except Exception:
+            logger.warning(
+                "GPU delegate unavailable for %s; using CPU.", os.path.basename(model_path)
+            )
+    return stack.enter_context(landmarker_cls.create_from_options(build_options(None)))
+
+
+def _run_landmarker_stage(
+    landmarker: Any,
+    inbox: queue.Queue,
+    handle: Callable[[object, int], None],
+    errors: list[BaseException],
+) -> None:
+    """Feed queued (mp_image, timestamp_ms, replay) frames to one landmarker until the None sentinel.
+
+    Replay frames (NON_VERBAL_MOTION_GATE, NON_VERBAL_FACE_STRIDE) reuse the last
+    result instead of running inference. After a failure the stage keeps draining its queue so the
+    decoder never blocks on it.
+    """
+    failed = False
+    last_result: object | None = None
+    while True:
+        item = inbox.get()
+        if item is None:
+            return
+        if failed:
+            continue
+        mp_image, timestamp_ms, replay = item
+        try:
+            if not replay or last_result is None:
+                last_result = landmarker.detect_for_video(mp_image, timestamp_ms)
+            handle(last_result, timestamp_ms)
+        except BaseException as exc:
+            errors.append(exc)
+            failed = True
+
+
 def analyze_nonverbal(video_path: str, target_fps: int = 5) -> dict:
     """
     Analyze hand motion in a video and return non-verbal activity metrics.
 
     - Samples frames at target_fps.
     - Runs MediaPipe Tasks HandLandmarker in VIDEO mode (requires timestamp_ms).
+    - Decoding and the hand/face/pose landmarkers run as parallel stages, so wall
+      time tracks the slowest stage rather than their sum.
     - For consecutive valid hand vectors:
         frame_velocity = mean(abs(curr_vec - prev_vec))
       avg_velocity = mean(frame_velocity over valid transitions)
@@ -360,9 +497,11 @@ def analyze_nonverbal(video_path: str, target_fps: int = 5) -> dict:
     cap = None
 
     try:
-        if cv2 is None or mp is None or mp_python is None or mp_vision is None:
+        if not _load_vision_deps():
             return _build_empty_response(samples=0)
 
+        import numpy as np
+
         if not os.path.exists(video_path):
             return _build_empty_response(samples=0)
 
@@ -380,7 +519,7 @@ def analyze_nonverbal(video_path: str, target_fps: int = 5) -> dict:
             "NON_VERBAL_POSE_MODEL_PATH", DEFAULT_POSE_MODEL_CANDIDATES
         )
 
-        cap = cv2.VideoCapture(video_path)
+        cap = _open_video_capture(video_path)
         if not cap.isOpened():
             return _build_empty_response(samples=0)
 
@@ -390,109 +529,178 @@ def analyze_nonverbal(video_path: str, target_fps: int = 5) -> dict:
         safe_target_fps = max(1, int(target_fps))
         frame_stride = max(1, int(round(effective_source_fps / safe_target_fps)))
 
-        hand_base_options = mp_python.BaseOptions(model_asset_path=hand_model_path)
-        hand_options = mp_vision.HandLandmarkerOptions(
-            base_options=hand_base_options,
-            running_mode=mp_vision.RunningMode.VIDEO,
-            num_hands=2,
-            min_hand_detection_confidence=0.5,
-            min_hand_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
-        face_options = None
-        if face_model_path is not None:
-            face_options = mp_vision.FaceLandmarkerOptions(
-                base_options=mp_python.BaseOptions(model_asset_path=face_model_path),
-                running_mode=mp_vision.RunningMode.VIDEO,
-                num_faces=1,
-            )
-        pose_options = None
-        if pose_model_path is not None:
-            pose_options = mp_vision.PoseLandmarkerOptions(
-                base_options=mp_python.BaseOptions(model_asset_path=pose_model_path),
-                running_mode=mp_vision.RunningMode.VIDEO,
-                num_poses=1,
-            )
-
-        velocities: list[float] = []
-        prev_vec: list[float] | None = None
-        prev_mid_shoulder: tuple[float, float] | None = None
+        # running sums; the per-frame series themselves are never needed
+        velocity_sum = 0.0
+        velocity_count = 0
+        prev_vec: Any | None = None
         frame_index = 0
         attention_timestamps: list[float] = []
         attention_flags: list[bool] = []
-        sway_timestamps: list[float] = []
-        sway_values: list[float] = []
-        sway_flags: list[bool] = []
+        # sway is diffed from these in one pass after the loop
+        shoulder_timestamps: list[float] = []
+        shoulder_positions: list[tuple[float, float]] = []
 
         with ExitStack() as stack:
-            hand_landmarker = stack.enter_context(
-                mp_vision.HandLandmarker.create_from_options(hand_options)
+            hand_landmarker = _open_landmarker(
+                stack,
+                mp_vision.HandLandmarker,
+                mp_vision.HandLandmarkerOptions,
+                hand_model_path,
+                num_hands=2,
+                min_hand_detection_confidence=0.5,
+                min_hand_presence_confidence=0.5,
+                min_tracking_confidence=0.5,
             )
             face_landmarker = (
-                stack.enter_context(mp_vision.FaceLandmarker.create_from_options(face_options))
-                if face_options is not None
+                _open_landmarker(
+                    stack,
+                    mp_vision.FaceLandmarker,
+                    mp_vision.FaceLandmarkerOptions,
+                    face_model_path,
+                    num_faces=1,
+                )
+                if face_model_path is not None
                 else None
             )
             pose_landmarker = (
-                stack.enter_context(mp_vision.PoseLandmarker.create_from_options(pose_options))
-                if pose_options is not None
+                _open_landmarker(
+                    stack,
+                    mp_vision.PoseLandmarker,
+                    mp_vision.PoseLandmarkerOptions,
+                    pose_model_path,
+                    num_poses=1,
+                )
+                if pose_model_path is not None
                 else None
             )
 
-            while True:
-                success, frame = cap.read()
-                if not success:
-                    break
-
-                # timestamp based on ORIGINAL frame index (not sampled count)
-                timestamp_ms = int((frame_index / effective_source_fps) * 1000)
-
-                # skip frames to hit target fps
-                if frame_index % frame_stride != 0:
-                    frame_index += 1
-                    continue
-
-                samples += 1
-
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-
-                hand_result = hand_landmarker.detect_for_video(mp_image, timestamp_ms)
-                curr_vec = _extract_hand_vector_task(hand_result)
+            def on_hand(result: object, timestamp_ms: int) -> None:
+                nonlocal prev_vec, velocity_sum, velocity_count
+                curr_vec = _extract_hand_vector_task(result)
                 if curr_vec is not None and prev_vec is not None:
-                    diff = [abs(c - p) for c, p in zip(curr_vec, prev_vec)]
-                    velocities.append(_mean(diff))
+                    # float32 sum / count is exactly .mean(), minus its ~3 us of dispatch overhead
+                    diff_sum = np.abs(curr_vec - prev_vec).sum()
+                    velocity_sum += float(diff_sum / np.float32(curr_vec.size))
+                    velocity_count += 1
 
                 # update prev_vec only if we have a current hand vector
                 if curr_vec is not None:
                     prev_vec = curr_vec
 
-                if face_landmarker is not None:
-                    face_result = face_landmarker.detect_for_video(mp_image, timestamp_ms)
-                    attention_timestamps.append(timestamp_ms / 1000.0)
-                    attention_flags.append(_estimate_attention(face_result))
-
-                if pose_landmarker is not None:
-                    pose_result = pose_landmarker.detect_for_video(mp_image, timestamp_ms)
-                    curr_mid_shoulder = _extract_pose_mid_shoulder(pose_result)
-                    if curr_mid_shoulder is not None and prev_mid_shoulder is not None:
-                        sway = (
-                            ((curr_mid_shoulder[0] - prev_mid_shoulder[0]) ** 2)
-                            + ((curr_mid_shoulder[1] - prev_mid_shoulder[1]) ** 2)
-                        ) ** 0.5
-                        sway_timestamps.append(timestamp_ms / 1000.0)
-                        sway_values.append(float(sway))
-                        sway_flags.append(sway >= SWAY_EVENT_THRESHOLD)
-                    if curr_mid_shoulder is not None:
-                        prev_mid_shoulder = curr_mid_shoulder
-
-                frame_index += 1
-
-        avg_velocity = _mean(velocities)
+            def on_face(result: object, timestamp_ms: int) -> None:
+                attention_timestamps.append(timestamp_ms / 1000.0)
+                attention_flags.append(_estimate_attention(result))
+
+            def on_pose(result: object, timestamp_ms: int) -> None:
+                mid_shoulder = _extract_pose_mid_shoulder(result)
+                if mid_shoulder is not None:
+                    shoulder_timestamps.append(timestamp_ms / 1000.0)
+                    shoulder_positions.append(mid_shoulder)
+
+            # One worker thread per landmarker, each owning its instance; this thread
+            # decodes and fans the same mp.Image out to every stage.
+            stages = [("hand", hand_landmarker, on_hand)]
+            if face_landmarker is not None:
+                stages.append(("face", face_landmarker, on_face))
+            if pose_landmarker is not None:
+                stages.append(("pose", pose_landmarker, on_pose))
+
+            stage_errors: list[BaseException] = []
+            inboxes: list[tuple[queue.Queue, str]] = []
+            workers: list[threading.Thread] = []
+            for name, landmarker, handle in stages:
+                inbox: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_MAXSIZE)
+                worker = threading.Thread(
+                    target=_run_landmarker_stage,
+                    args=(landmarker, inbox, handle, stage_errors),
+                    name=f"non-verbal-{name}",
+                    daemon=True,
+                )
+                worker.start()
+                inboxes.append((inbox, name))
+                workers.append(worker)
+
+            rgb_buf = None
+            srgb_format = mp.ImageFormat.SRGB
+            # grayscale of the last frame face/pose actually ran on
+            reference_gray = None
+            gray_buf = None
+            try:
+                while True:
+                    # grab() only advances the stream; the BGR conversion in retrieve()
+                    # is paid for sampled frames alone
+                    if not cap.grab():
+                        break
+
+                    # skip frames to hit target fps
+                    if frame_index % frame_stride != 0:
+                        frame_index += 1
+                        continue
+
+                    success, frame = cap.retrieve()
+                    if not success:
+                        break
+
+                    # timestamp based on ORIGINAL frame index (not sampled count)
+                    timestamp_ms = int((frame_index / effective_source_fps) * 1000)
+                    samples += 1
+
+                    # landmarks are normalized, so a smaller frame only trims pre-processing
+                    height, width = frame.shape[:2]
+                    if width > INFERENCE_MAX_WIDTH:
+                        scaled_height = max(1, round(height * INFERENCE_MAX_WIDTH / width))
+                        frame = cv2.resize(
+                            frame,
+                            (INFERENCE_MAX_WIDTH, scaled_height),
+                            interpolation=cv2.INTER_AREA,
+                        )
+
+                    # mp.Image copies the pixels, so one RGB buffer serves every frame
+                    if rgb_buf is None or rgb_buf.shape != frame.shape:
+                        rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                    mp_image = mp.Image(image_format=srgb_format, data=rgb_buf)
+
+                    static = False
+                    if NON_VERBAL_MOTION_GATE > 0:
+                        if gray_buf is None or gray_buf.shape != frame.shape[:2]:
+                            gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+                        static = (
+                            reference_gray is not None
+                            and reference_gray.shape == gray_buf.shape
+                            and float(cv2.absdiff(reference_gray, gray_buf).mean())
+                            < NON_VERBAL_MOTION_GATE
+                        )
+                        if not static:
+                            # keep this frame as the reference; recycle the old one's buffer
+                            reference_gray, gray_buf = gray_buf, reference_gray
+
+                    # Hand velocity needs every frame; face/pose may reuse their last result.
+                    replay = {
+                        "hand": False,
+                        "face": static or (samples - 1) % NON_VERBAL_FACE_STRIDE != 0,
+                        "pose": static,
+                    }
+                    for inbox, name in inboxes:
+                        # blocks when a stage falls behind, bounding frames in flight
+                        inbox.put((mp_image, timestamp_ms, replay[name]))
+
+                    frame_index += 1
+            finally:
+                for inbox, _ in inboxes:
+                    inbox.put(None)
+                for worker in workers:
+                    worker.join()
+
+            if stage_errors:
+                raise stage_errors[0]
+
+        avg_velocity = velocity_sum / velocity_count if velocity_count else 0.0
         gesture_energy = _clamp(avg_velocity * GESTURE_ENERGY_SCALE, 0.0, 10.0)
-        activity_level = _classify_activity(gesture_energy, transitions=len(velocities))
+        activity_level = _classify_activity(gesture_energy, transitions=velocity_count)
 
-        attentive_count = sum(1 for attentive in attention_flags if attentive)
+        attentive_count = attention_flags.count(True)
         eye_contact_pct = (
             (attentive_count / len(attention_flags)) * 100.0 if attention_flags else 0.0
         )
@@ -504,10 +712,18 @@ def analyze_nonverbal(video_path: str, target_fps: int = 5) -> dict:
             ATTENTION_MIN_SEGMENT_SECONDS,
         )
 
-        sway_score = _mean(sway_values)
+        # sway = distance between consecutive valid mid-shoulder positions
+        sway_series = np.linalg.norm(
+            np.diff(np.asarray(shoulder_positions, dtype=np.float64).reshape(-1, 2), axis=0),
+            axis=1,
+        )
+        sway_count = int(sway_series.size)
+        sway_score = float(sway_series.mean()) if sway_count else 0.0
+        sway_timestamps = shoulder_timestamps[1:]
+        sway_flags = (sway_series >= SWAY_EVENT_THRESHOLD).tolist()
         posture_stability = _posture_stability_from_sway(sway_score)
         posture_score = posture_stability
-        posture_level = _classify_posture(posture_stability, len(sway_values))
+        posture_level = _classify_posture(posture_stability, sway_count)
         posture_events = _segments_from_flags(
             sway_timestamps, sway_flags, POSTURE_EVENT_MIN_SECONDS
         )
@@ -0,0 +1,73 @@
+"""Voiced-frame selection in the batched pitch scan.
+
+Run from backend/: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main  # noqa: E402
+
+SR = 16000
+
+
+def _integer_lag_pitches(samples: np.ndarray, sample_rate: int) -> list[float]:
+    """The per-frame np.correlate walk the batched scan replaced (integer-lag f0)."""
+    frame_size = int(0.04 * sample_rate)
+    hop_size = max(1, int(0.02 * sample_rate))
+    min_lag = max(1, int(sample_rate / 320))
+    max_lag = max(min_lag + 1, int(sample_rate / 75))
+    window = np.hanning(frame_size).astype(np.float32)
+    pitches = []
+    for start in range(0, len(samples) - frame_size, hop_size):
+        frame = samples[start : start + frame_size]
+        frame = frame - float(np.mean(frame))
+        if float(np.sqrt(np.mean(frame * frame))) < 0.008:
+            continue
+        weighted = frame * window
+        autocorr = np.correlate(weighted, weighted, mode="full")[frame_size - 1 :]
+        zero_lag = float(autocorr[0])
+        if zero_lag <= 0:
+            continue
+        peak_idx = int(np.argmax(autocorr[min_lag : max_lag + 1])) + min_lag
+        if float(autocorr[peak_idx]) / (zero_lag + 1e-9) < 0.30:
+            continue
+        f0 = sample_rate / peak_idx
+        if 75 <= f0 <= 320:
+            pitches.append(f0)
+    return pitches
+
+
+def _glide(start_hz: float, end_hz: float, seconds: float) -> np.ndarray:
+    hz = np.linspace(start_hz, end_hz, int(seconds * SR))
+    return (0.3 * np.sin(2 * np.pi * np.cumsum(hz) / SR)).astype(np.float32)
+
+
+class PitchScanTest(unittest.TestCase):
+    def _assert_same_voiced_frames(self, samples: np.ndarray) -> None:
+        expected = _integer_lag_pitches(samples, SR)
+        pitches, _ = main._scan_delivery_frames(samples, SR, volume=False)
+
+        self.assertEqual(len(pitches), len(expected))
+        # Refinement moves each estimate by at most half a lag.
+        for refined, coarse in zip(pitches, expected):
+            lag = SR / coarse
+            self.assertLessEqual(abs(SR / refined - lag), 0.5 + 1e-3)
+
+    def test_frames_near_band_edges_are_kept(self):
+        for edge_hz in (74.0, 75.5, 76.0, 318.0, 319.5, 321.0):
+            with self.subTest(hz=edge_hz):
+                self._assert_same_voiced_frames(_glide(edge_hz, edge_hz, 1.0))
+
+    def test_glide_across_the_band_keeps_frame_count(self):
+        samples = np.concatenate((_glide(70.0, 330.0, 3.0), _glide(330.0, 70.0, 3.0)))
+        self._assert_same_voiced_frames(samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
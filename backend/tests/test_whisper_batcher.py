@@ -0,0 +1,108 @@
+"""Word assignment and isolation in the opt-in Whisper clip batcher.
+
+Run from backend/: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main  # noqa: E402
+
+SR = main.WHISPER_SAMPLE_RATE
+
+
+class FakeWhisperModel:
+    """Emits one word per run of non-zero samples; the sign picks the language.
+
+    Word ends overrun the speech by 0.4 s, as Whisper's alignment often does, so
+    speech that touches a clip boundary spills into the gap that follows it.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def detect_language(self, audio):
+        if np.isnan(audio).any():
+            raise ValueError("undecodable clip")
+        return ("en" if audio[np.nonzero(audio)[0][0]] > 0 else "de"), 0.99, []
+
+    def transcribe(self, audio, language=None, **options):
+        self.calls.append({"seconds": len(audio) / SR, "language": language, **options})
+        if np.isnan(audio).any():
+            raise ValueError("bad clip in call")
+        voiced = np.concatenate(([0], (audio != 0).astype(np.int8), [0]))
+        edges = np.flatnonzero(np.diff(voiced))
+        segments = []
+        for k, (start, stop) in enumerate(zip(edges[::2], edges[1::2])):
+            word = SimpleNamespace(word=f" {language}{k}", start=start / SR, end=stop / SR + 0.4)
+            segments.append(SimpleNamespace(words=[word]))
+        return iter(segments), SimpleNamespace(language=language)
+
+
+def _clip(seconds: float, speech: list[tuple[float, float]], value: float) -> np.ndarray:
+    audio = np.zeros(int(seconds * SR), dtype=np.float32)
+    for start, stop in speech:
+        audio[int(start * SR):int(stop * SR)] = value
+    return audio
+
+
+class WhisperClipBatcherTest(unittest.TestCase):
+    def _run(self, clips: list[np.ndarray]) -> tuple[FakeWhisperModel, list[Future]]:
+        model = FakeWhisperModel()
+        futures = [Future() for _ in clips]
+        with mock.patch.object(main, "get_whisper_model", return_value=model):
+            main._WhisperClipBatcher()._transcribe_batch(list(zip(clips, futures)))
+        return model, futures
+
+    def test_speech_at_clip_boundary_stays_with_its_clip(self):
+        first = _clip(3.0, [(0.5, 1.0), (2.2, 3.0)], 0.5)   # speaks up to the last sample
+        second = _clip(2.0, [(0.0, 0.6)], 0.5)              # speaks from the first sample
+        model, (a, b) = self._run([first, second])
+
+        self.assertEqual(len(model.calls), 1)
+        self.assertFalse(model.calls[0]["vad_filter"])
+        self.assertEqual(a.result(), ("en0 en1", [
+            {"word": "en0", "start": 0.5, "end": 1.4, "index": 0},
+            {"word": "en1", "start": 2.2, "end": 3.4, "index": 1},
+        ]))
+        self.assertEqual(b.result(), ("en2", [
+            {"word": "en2", "start": 0.0, "end": 1.0, "index": 0},
+        ]))
+
+    def test_different_languages_are_not_packed_together(self):
+        english = _clip(2.0, [(0.2, 1.0)], 0.5)
+        german = _clip(2.0, [(0.2, 1.0)], -0.5)
+        model, (en, de, en_again) = self._run([english, german, english.copy()])
+
+        self.assertEqual(sorted(call["language"] for call in model.calls), ["de", "en"])
+        self.assertEqual(en.result()[0], "en0")
+        self.assertEqual(de.result()[0], "de0")
+        self.assertEqual(en_again.result()[0], "en1")
+
+    def test_bad_clip_only_fails_its_own_request(self):
+        good = _clip(2.0, [(0.2, 1.0)], 0.5)
+        bad = good.copy()
+        bad[-1] = np.nan
+        model = FakeWhisperModel()
+        model.detect_language = lambda audio: ("en", 0.99, [])
+        futures = [Future(), Future(), Future()]
+        with mock.patch.object(main, "get_whisper_model", return_value=model):
+            main._WhisperClipBatcher()._transcribe_batch(
+                list(zip([good, bad, good.copy()], futures))
+            )
+
+        self.assertEqual(futures[0].result()[0], "en0")
+        self.assertIsInstance(futures[1].exception(), ValueError)
+        self.assertEqual(futures[2].result()[0], "en0")
+
+
+if __name__ == "__main__":
+    unittest.main()
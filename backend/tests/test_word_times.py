@@ -0,0 +1,55 @@
+"""Timestamp fallbacks for words Whisper did not time (transcript overrides, partial data).
+
+Run from backend/: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main  # noqa: E402
+
+PARTIAL_WORDS = [
+    {"word": "Hello.", "start": 0.0, "end": 0.5, "index": 0},
+    {"word": "there", "end": 2.0, "index": 1},
+    {"word": "friend", "start": 3.0, "index": 2},
+    {"word": "ok", "start": 3.5, "end": 4.0, "index": 3},
+]
+
+
+class WordTimesTest(unittest.TestCase):
+    def test_complete_timestamps_take_the_fast_path(self):
+        words = [{"word": "a", "start": 0, "end": 0.25}, {"word": "b", "start": 0.5, "end": 1}]
+        self.assertEqual(main._word_times(words), ([0.0, 0.5], [0.25, 1.0]))
+        self.assertIsNone(main._word_times(PARTIAL_WORDS))
+
+    def test_pauses_keep_their_own_defaults(self):
+        # A missing end counts as 0.0 and a missing start as the previous word's
+        # end, so "friend" -> "ok" reads as a long silence from 0.0.
+        result = main.analyze_silence_quality(PARTIAL_WORDS)
+        self.assertEqual(result["effective_examples"], [{"start": 2.0, "end": 3.0, "duration": 1.0}])
+        self.assertEqual(result["awkward_examples"], [{"start": 0.0, "end": 3.5, "duration": 3.5}])
+        self.assertEqual(result["pause_quality"], "needs_work")
+
+    def test_spans_keep_their_own_defaults(self):
+        # A missing start is the running end so far, a missing end the word's start.
+        spans = main._build_sentence_spans(PARTIAL_WORDS, 10.0)
+        self.assertEqual(spans, [(0.0, 0.5), (0.5, 2.0), (3.0, 4.0)])
+
+    def test_shared_times_match_per_caller_fallbacks(self):
+        boundaries = main._sentence_boundary_flags(PARTIAL_WORDS)
+        times = main._word_times(PARTIAL_WORDS)
+        self.assertEqual(
+            main.analyze_silence_quality(PARTIAL_WORDS, boundaries, times),
+            main.analyze_silence_quality(PARTIAL_WORDS),
+        )
+        self.assertEqual(
+            main._build_sentence_spans(PARTIAL_WORDS, 10.0, boundaries, times),
+            main._build_sentence_spans(PARTIAL_WORDS, 10.0),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()